@@ -4,6 +4,10 @@
 アプリケーション全体の制御を担当します。
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
 from src.controller.data_controller import DataController
 from src.controller.plot_controller import PlotController
 from src.model.data_loader import DataLoaderFactory
@@ -32,6 +36,11 @@ class AppController:
         # ビューの参照
         self.main_window = None
 
+        # データ処理用のワーカースレッド
+        # （pandas/NumPyの処理中はGILが解放されるため、Tkのメインループを
+        # ブロックせずに重い処理を実行できる）
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
     def set_main_window(self, main_window):
         """
         メインウィンドウの設定
@@ -103,14 +112,15 @@ class AppController:
             y_column (str): Y軸の列名
             value_column (str): 値の列名
         """
-        # データプロセッサーに軸を設定
-        self.data_processor.set_axes(x_column, y_column, value_column)
+        # 軸の設定からヒートマップ配列の構築までをワーカースレッドで実行
+        # （プロセッサーの変更を単一ワーカーに直列化しつつ、O(N)のグリッド
+        # 構築もメインループから外す。完了後にプロットへ反映する）
+        def job():
+            self.data_processor.set_axes(x_column, y_column, value_column)
+            self.data_processor.process_data()
+            return self._build_plot_data()
 
-        # データの処理
-        self.data_processor.process_data()
-
-        # プロットの更新
-        self._update_plot()
+        self._process_data_async(self._apply_plot_data, job=job)
 
     def set_filter(self, column, value):
         """
@@ -120,14 +130,14 @@ class AppController:
             column (str): フィルター対象の列名
             value (float): フィルター値
         """
-        # データプロセッサーにフィルターを設定
-        self.data_processor.set_filter(column, value)
-
-        # データの処理
-        self.data_processor.process_data()
+        # フィルターの設定からヒートマップ配列の構築までをワーカースレッドで
+        # 実行し、完了後にプロットへ反映する
+        def job():
+            self.data_processor.set_filter(column, value)
+            self.data_processor.process_data()
+            return self._build_plot_data()
 
-        # プロットの更新
-        self._update_plot()
+        self._process_data_async(self._apply_plot_data, job=job)
 
     def update_filter_values(self, column):
         """
@@ -181,7 +191,9 @@ class AppController:
             colormap (str): カラーマップ名
         """
         # プロットパネルにカラーマップを設定
-        self.main_window.plot_panel.set_colormap(colormap)
+        # （未構築の場合は設定のみ保持され、構築時に反映される）
+        if self.main_window.plot_panel is not None:
+            self.main_window.plot_panel.set_colormap(colormap)
 
     def set_scale(self, log_scale):
         """
@@ -191,7 +203,9 @@ class AppController:
             log_scale (bool): 対数スケールの場合はTrue、線形スケールの場合はFalse
         """
         # プロットパネルにスケールを設定
-        self.main_window.plot_panel.set_scale(log_scale)
+        # （未構築の場合は設定のみ保持され、構築時に反映される）
+        if self.main_window.plot_panel is not None:
+            self.main_window.plot_panel.set_scale(log_scale)
 
     def set_ranges(self, x_range, y_range, value_range):
         """
@@ -246,39 +260,121 @@ class AppController:
 
     def reset_view(self):
         """表示のリセット"""
-        # データの再処理
-        self.data_processor.process_data()
+        def job():
+            self.data_processor.process_data()
+            return self._build_plot_data()
+
+        def on_done(plot_data):
+            # プロットの更新
+            self._apply_plot_data(plot_data)
 
-        # プロットの更新
-        self._update_plot()
+            # ステータスバーの更新
+            self.update_status("表示をリセットしました。")
 
-        # ステータスバーの更新
-        self.update_status("表示をリセットしました。")
+        # データの再処理（ワーカースレッドで実行）
+        self._process_data_async(on_done, job=job)
+
+    def _process_data_async(self, on_done, job=None):
+        """
+        データ処理をワーカースレッドで実行します。
+
+        Tkのメインループをブロックしないよう、処理をワーカースレッドに
+        投入し、after()によるポーリングで完了を待ってからコールバックを呼びます。
+        ワーカーは1本のみなので、ここを経由する処理はすべて直列に実行され、
+        プロセッサーへの並行アクセスは発生しません。
+
+        Args:
+            on_done (callable): 処理完了後にメインスレッドで実行するコールバック
+                （引数としてjobの戻り値を受け取ります）
+            job (callable, optional): ワーカースレッドで実行する処理
+                （Noneの場合はprocess_dataを実行）
+        """
+        if job is None:
+            job = self.data_processor.process_data
+
+        # メインウィンドウがない場合（テストなど）は同期実行
+        if self.main_window is None:
+            on_done(job())
+            return
+
+        future = self._executor.submit(job)
+        self._poll_future(future, on_done)
+
+    def _poll_future(self, future, on_done):
+        """
+        ワーカースレッドの処理完了をポーリングします。
+
+        Args:
+            future: 監視対象のFuture
+            on_done (callable): 処理完了後に実行するコールバック
+                （引数として処理の戻り値を受け取ります）
+        """
+        if not future.done():
+            self.main_window.root.after(30, lambda: self._poll_future(future, on_done))
+            return
 
-    def _update_plot(self):
-        """プロットの更新"""
-        # ヒートマップデータの取得
         try:
-            x_data, y_data, z_data = self.data_processor.get_heatmap_data()
+            result = future.result()
+        except Exception as e:
+            self.show_error("データ処理エラー", str(e))
+        else:
+            on_done(result)
+
+    def _build_plot_data(self):
+        """
+        プロット更新に必要なデータをまとめて構築します。
+
+        ヒートマップのグリッド構築はデータ点数に比例するコストがかかるため、
+        ワーカースレッド上で呼び出してメインループをブロックしないようにします。
+        結果はプロセッサーのキャッシュにも載るので、メインスレッド側の
+        後続の参照はキャッシュヒットになります。
+
+        Returns:
+            dict: ヒートマップ配列と各範囲をまとめた辞書
+        """
+        return {
+            'heatmap': self.data_processor.get_heatmap_data(),
+            'x_range': self.data_processor.get_axis_range('x'),
+            'y_range': self.data_processor.get_axis_range('y'),
+            'value_range': self.data_processor.get_value_range(),
+        }
+
+    def _apply_plot_data(self, plot_data):
+        """
+        ワーカーで構築したプロットデータをビューに反映します。
+
+        Args:
+            plot_data (dict): _build_plot_dataが返した辞書
+        """
+        try:
+            x_data, y_data, z_data = plot_data['heatmap']
 
             # 軸ラベルの取得
             x_label = self.main_window.control_panel.x_column.get()
             y_label = self.main_window.control_panel.y_column.get()
 
-            # プロットの更新
-            self.main_window.plot_panel.plot_heatmap(
-                x_data, y_data, z_data,
-                x_label, y_label
-            )
-
-            # 範囲の取得
-            x_range = self.data_processor.get_axis_range('x')
-            y_range = self.data_processor.get_axis_range('y')
-            value_range = self.data_processor.get_value_range()
+            # プロットの更新（初回はここでプロットパネルを構築する）
+            plot_panel = self.main_window.ensure_plot_panel()
+
+            # 軸とラベルが前回と同じでZ値だけが変わった場合（フィルター変更
+            # など）は、Figure・カラーバーを作り直さず既存アーティストへの
+            # データ転送だけで更新する
+            if (plot_panel.im is not None
+                    and plot_panel.x_data is not None
+                    and np.array_equal(plot_panel.x_data, x_data)
+                    and np.array_equal(plot_panel.y_data, y_data)
+                    and plot_panel.ax.get_xlabel() == x_label
+                    and plot_panel.ax.get_ylabel() == y_label):
+                plot_panel.update_heatmap(z_data)
+            else:
+                plot_panel.plot_heatmap(
+                    x_data, y_data, z_data,
+                    x_label, y_label
+                )
 
             # コントロールパネルの更新
             self.main_window.control_panel.update_ranges(
-                x_range, y_range, value_range
+                plot_data['x_range'], plot_data['y_range'], plot_data['value_range']
             )
 
         except Exception as e:
@@ -294,6 +390,18 @@ class AppController:
         if self.main_window:
             self.main_window.update_status(message)
 
+    def update_coords(self, x, y, value=None):
+        """
+        ステータスバーの座標表示の更新
+
+        Args:
+            x (float): X座標
+            y (float): Y座標
+            value (float, optional): 座標位置のデータ値
+        """
+        if self.main_window:
+            self.main_window.update_coords(x, y, value)
+
     def show_error(self, title, message):
         """
         エラーメッセージの表示
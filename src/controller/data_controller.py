@@ -131,27 +131,41 @@ class DataController:
             value: フィルター値
         """
         try:
-            # データフィルターに値フィルターを追加
-            self.app_controller.data_filter.add_value_filter(column, value)
+            def job():
+                # データフィルターに値フィルターを追加
+                self.app_controller.data_filter.add_value_filter(column, value)
 
-            # フィルタリングの適用
-            self.app_controller.data_filter.apply_filters()
+                # フィルタリングの適用
+                self.app_controller.data_filter.apply_filters()
 
-            # データプロセッサーにフィルタリング結果を設定
-            filtered_data = self.app_controller.data_filter.get_filtered_data()
-            self.app_controller.data_processor.set_data(filtered_data)
+                # データプロセッサーにフィルタリング結果を設定
+                filtered_data = self.app_controller.data_filter.get_filtered_data()
+                self.app_controller.data_processor.set_data(filtered_data)
 
-            # データの処理
-            self.app_controller.data_processor.process_data()
+                # データの処理とプロット用データの構築
+                # （ヒートマップのグリッド構築もワーカー側で済ませる）
+                self.app_controller.data_processor.process_data()
+                return self.app_controller._build_plot_data()
 
-            # プロットの更新
-            self._update_plot()
+            def on_done(plot_data):
+                # プロットの更新
+                self.app_controller._apply_plot_data(plot_data)
 
-            # ステータスバーの更新
-            filter_summary = self.app_controller.data_filter.get_filter_summary()
-            total_rows = filter_summary["total_rows"]
-            filtered_rows = filter_summary["filtered_rows"]
-            self.app_controller.update_status(f"フィルタリング: {filtered_rows}/{total_rows} 行 ({filtered_rows / total_rows * 100:.1f}%)")
+                # フィルタリストの表示を更新
+                # （ワーカーでの適用完了後に読むことで、変更前のフィルタを
+                # 表示してしまわないようにする）
+                self.app_controller.main_window.control_panel.update_filter_list()
+
+                # ステータスバーの更新
+                filter_summary = self.app_controller.data_filter.get_filter_summary()
+                total_rows = filter_summary["total_rows"]
+                filtered_rows = filter_summary["filtered_rows"]
+                self.app_controller.update_status(f"フィルタリング: {filtered_rows}/{total_rows} 行 ({filtered_rows / total_rows * 100:.1f}%)")
+
+            # フィルタリングと再処理をワーカースレッドで実行
+            # （プロセッサーの変更を単一ワーカーに直列化し、実行中の
+            # process_dataと競合しないようにする）
+            self.app_controller._process_data_async(on_done, job=job)
 
         except Exception as e:
             self.app_controller.show_error("フィルター設定エラー", str(e))
@@ -166,27 +180,38 @@ class DataController:
             max_val (float): 最大値
         """
         try:
-            # データフィルターに範囲フィルターを追加
-            self.app_controller.data_filter.add_range_filter(column, min_val, max_val)
+            def job():
+                # データフィルターに範囲フィルターを追加
+                self.app_controller.data_filter.add_range_filter(column, min_val, max_val)
 
-            # フィルタリングの適用
-            self.app_controller.data_filter.apply_filters()
+                # フィルタリングの適用
+                self.app_controller.data_filter.apply_filters()
 
-            # データプロセッサーにフィルタリング結果を設定
-            filtered_data = self.app_controller.data_filter.get_filtered_data()
-            self.app_controller.data_processor.set_data(filtered_data)
+                # データプロセッサーにフィルタリング結果を設定
+                filtered_data = self.app_controller.data_filter.get_filtered_data()
+                self.app_controller.data_processor.set_data(filtered_data)
 
-            # データの処理
-            self.app_controller.data_processor.process_data()
+                # データの処理とプロット用データの構築
+                # （ヒートマップのグリッド構築もワーカー側で済ませる）
+                self.app_controller.data_processor.process_data()
+                return self.app_controller._build_plot_data()
 
-            # プロットの更新
-            self._update_plot()
+            def on_done(plot_data):
+                # プロットの更新
+                self.app_controller._apply_plot_data(plot_data)
 
-            # ステータスバーの更新
-            filter_summary = self.app_controller.data_filter.get_filter_summary()
-            total_rows = filter_summary["total_rows"]
-            filtered_rows = filter_summary["filtered_rows"]
-            self.app_controller.update_status(f"フィルタリング: {filtered_rows}/{total_rows} 行 ({filtered_rows / total_rows * 100:.1f}%)")
+                # フィルタリストの表示を更新（適用完了後の状態を読む）
+                self.app_controller.main_window.control_panel.update_filter_list()
+
+                # ステータスバーの更新
+                filter_summary = self.app_controller.data_filter.get_filter_summary()
+                total_rows = filter_summary["total_rows"]
+                filtered_rows = filter_summary["filtered_rows"]
+                self.app_controller.update_status(f"フィルタリング: {filtered_rows}/{total_rows} 行 ({filtered_rows / total_rows * 100:.1f}%)")
+
+            # フィルタリングと再処理をワーカースレッドで実行
+            # （プロセッサーの変更を単一ワーカーに直列化する）
+            self.app_controller._process_data_async(on_done, job=job)
 
         except Exception as e:
             self.app_controller.show_error("フィルター設定エラー", str(e))
@@ -199,27 +224,38 @@ class DataController:
             column (str, optional): クリアする列名。Noneの場合はすべてクリア。
         """
         try:
-            # データフィルターのクリア
-            self.app_controller.data_filter.clear_filters(column)
+            def job():
+                # データフィルターのクリア
+                self.app_controller.data_filter.clear_filters(column)
 
-            # フィルタリングの適用
-            self.app_controller.data_filter.apply_filters()
+                # フィルタリングの適用
+                self.app_controller.data_filter.apply_filters()
 
-            # データプロセッサーにフィルタリング結果を設定
-            filtered_data = self.app_controller.data_filter.get_filtered_data()
-            self.app_controller.data_processor.set_data(filtered_data)
+                # データプロセッサーにフィルタリング結果を設定
+                filtered_data = self.app_controller.data_filter.get_filtered_data()
+                self.app_controller.data_processor.set_data(filtered_data)
 
-            # データの処理
-            self.app_controller.data_processor.process_data()
+                # データの処理とプロット用データの構築
+                # （ヒートマップのグリッド構築もワーカー側で済ませる）
+                self.app_controller.data_processor.process_data()
+                return self.app_controller._build_plot_data()
 
-            # プロットの更新
-            self._update_plot()
+            def on_done(plot_data):
+                # プロットの更新
+                self.app_controller._apply_plot_data(plot_data)
 
-            # ステータスバーの更新
-            if column:
-                self.app_controller.update_status(f"フィルター '{column}' をクリアしました。")
-            else:
-                self.app_controller.update_status("すべてのフィルターをクリアしました。")
+                # フィルタリストの表示を更新（クリア完了後の状態を読む）
+                self.app_controller.main_window.control_panel.update_filter_list()
+
+                # ステータスバーの更新
+                if column:
+                    self.app_controller.update_status(f"フィルター '{column}' をクリアしました。")
+                else:
+                    self.app_controller.update_status("すべてのフィルターをクリアしました。")
+
+            # フィルタリングと再処理をワーカースレッドで実行
+            # （プロセッサーの変更を単一ワーカーに直列化する）
+            self.app_controller._process_data_async(on_done, job=job)
 
         except Exception as e:
             self.app_controller.show_error("フィルタークリアエラー", str(e))
@@ -247,8 +283,8 @@ class DataController:
             x_label = self.app_controller.main_window.control_panel.x_column.get()
             y_label = self.app_controller.main_window.control_panel.y_column.get()
 
-            # プロットの更新
-            self.app_controller.main_window.plot_panel.plot_heatmap(
+            # プロットの更新（初回はここでプロットパネルを構築する）
+            self.app_controller.main_window.ensure_plot_panel().plot_heatmap(
                 x_data, y_data, z_data,
                 x_label, y_label
             )
@@ -275,7 +311,9 @@ class DataController:
         """
         try:
             # プロットパネルにカラーマップを設定
-            self.app_controller.main_window.plot_panel.set_colormap(colormap)
+            # （未構築の場合は設定のみ保持され、構築時に反映される）
+            if self.app_controller.main_window.plot_panel is not None:
+                self.app_controller.main_window.plot_panel.set_colormap(colormap)
 
         except Exception as e:
             self.app_controller.show_error("カラーマップ設定エラー", str(e))
@@ -289,7 +327,9 @@ class DataController:
         """
         try:
             # プロットパネルにスケールを設定
-            self.app_controller.main_window.plot_panel.set_scale(log_scale)
+            # （未構築の場合は設定のみ保持され、構築時に反映される）
+            if self.app_controller.main_window.plot_panel is not None:
+                self.app_controller.main_window.plot_panel.set_scale(log_scale)
 
         except Exception as e:
             self.app_controller.show_error("スケール設定エラー", str(e))
@@ -305,9 +345,10 @@ class DataController:
         """
         try:
             # プロットパネルに範囲を設定
-            self.app_controller.main_window.plot_panel.set_ranges(
-                x_range, y_range, value_range
-            )
+            if self.app_controller.main_window.plot_panel is not None:
+                self.app_controller.main_window.plot_panel.set_ranges(
+                    x_range, y_range, value_range
+                )
 
         except Exception as e:
             self.app_controller.show_error("範囲設定エラー", str(e))
@@ -321,9 +362,10 @@ class DataController:
             value_range = self.app_controller.data_processor.get_value_range()
 
             # プロットパネルに範囲を設定
-            self.app_controller.main_window.plot_panel.set_ranges(
-                x_range, y_range, value_range
-            )
+            if self.app_controller.main_window.plot_panel is not None:
+                self.app_controller.main_window.plot_panel.set_ranges(
+                    x_range, y_range, value_range
+                )
 
             # コントロールパネルの更新
             self.app_controller.main_window.control_panel.update_ranges(
@@ -383,6 +425,11 @@ class DataController:
             file_path (str): 出力ファイルパス
         """
         try:
+            # プロットが未構築の場合は保存できない
+            if self.app_controller.main_window.plot_panel is None:
+                self.app_controller.show_error("画像エクスポートエラー", "エクスポートするプロットがありません。")
+                return
+
             # プロットを画像として保存
             self.app_controller.main_window.plot_panel.figure.savefig(
                 file_path, dpi=300, bbox_inches='tight'
@@ -64,8 +64,9 @@ class PlotController:
             x_label = self.app_controller.main_window.control_panel.x_column.get()
             y_label = self.app_controller.main_window.control_panel.y_column.get()
 
-            # プロットの更新
-            self.app_controller.main_window.plot_panel.plot_heatmap(
+            # プロットの更新（初回はここでプロットパネルを構築する）
+            plot_panel = self.app_controller.main_window.ensure_plot_panel()
+            plot_panel.plot_heatmap(
                 x_data, y_data, z_data,
                 x_label, y_label,
                 vmin=self.value_range[0] if self.value_range else None,
@@ -73,10 +74,12 @@ class PlotController:
             )
 
             # 範囲の設定
+            # （draw_idleでアイドル時に1回だけ再描画する。範囲変更が連続する
+            # 場合に同期的なdraw()だと毎回フル再描画が走ってしまう）
             if self.x_range and self.y_range:
-                self.app_controller.main_window.plot_panel.ax.set_xlim(self.x_range)
-                self.app_controller.main_window.plot_panel.ax.set_ylim(self.y_range)
-                self.app_controller.main_window.plot_panel.canvas.draw()
+                plot_panel.ax.set_xlim(self.x_range)
+                plot_panel.ax.set_ylim(self.y_range)
+                plot_panel.canvas.draw_idle()
 
         except Exception as e:
             self.app_controller.show_error("プロット更新エラー", str(e))
@@ -110,7 +113,9 @@ class PlotController:
         Args:
             enabled (bool): 断面表示モードを有効にする場合はTrue
         """
-        self.app_controller.main_window.plot_panel.set_profile_mode(enabled)
+        # プロットパネルが未構築（データ未読み込み）の場合は何もしない
+        if self.app_controller.main_window.plot_panel is not None:
+            self.app_controller.main_window.plot_panel.set_profile_mode(enabled)
 
     def show_profiles(self, click_point):
         """
@@ -157,7 +162,9 @@ class PlotController:
             colormap (str): カラーマップ名
         """
         # プロットパネルにカラーマップを設定
-        self.app_controller.main_window.plot_panel.set_colormap(colormap)
+        # （未構築の場合は設定のみ保持され、構築時に反映される）
+        if self.app_controller.main_window.plot_panel is not None:
+            self.app_controller.main_window.plot_panel.set_colormap(colormap)
 
     def set_scale(self, log_scale):
         """
@@ -167,4 +174,6 @@ class PlotController:
             log_scale (bool): 対数スケールの場合はTrue、線形スケールの場合はFalse
         """
         # プロットパネルにスケールを設定
-        self.app_controller.main_window.plot_panel.set_scale(log_scale)
+        # （未構築の場合は設定のみ保持され、構築時に反映される）
+        if self.app_controller.main_window.plot_panel is not None:
+            self.app_controller.main_window.plot_panel.set_scale(log_scale)
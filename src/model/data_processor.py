@@ -29,6 +29,11 @@ class DataProcessor:
         self._cache: Dict[str, any] = {}
         self._cache_invalidated: bool = True
 
+        # フィルター列ごとのマスクのキャッシュ
+        # （スライダー操作などで1列だけ値が変わったとき、他の列のマスクを
+        # 再計算せずに済ませるため）
+        self._filter_masks: Dict[str, np.ndarray] = {}
+
     def _invalidate_cache(self) -> None:
         """キャッシュを無効化します。"""
         self._cache.clear()
@@ -42,7 +47,24 @@ class DataProcessor:
             data (pd.DataFrame): 処理対象のデータフレーム
         """
         self.data = data.copy()
-        self.processed_data = data.copy()
+
+        # 文字列列（デバイスIDや測定名など）はカテゴリ型に変換
+        # （比較やグループ化が整数コードベースになり、メモリも削減できる）
+        # 文字列列はpandasのバージョンによってobject型またはstr型になる
+        # ため、両方を対象にする
+        for column in self.data.select_dtypes(include=['object', 'str']).columns:
+            self.data[column] = self.data[column].astype('category')
+
+        # pyarrowが利用可能な場合はArrowバックエンドのdtypeに変換
+        # （min/max/uniqueなどの集計がSIMD化されたArrowカーネルで実行される）
+        try:
+            import pyarrow  # noqa: F401
+            self.data = self.data.convert_dtypes(dtype_backend='pyarrow')
+        except ImportError:
+            pass
+
+        self.processed_data = self.data.copy()
+        self._filter_masks.clear()
         self._invalidate_cache()
 
     def _get_cache_key(self, prefix: str) -> str:
@@ -69,11 +91,11 @@ class DataProcessor:
         for column, value in sorted(self.filter_columns.items()):
             key_parts.append(f"f:{column}:{value}")
 
-        # データのハッシュ値（データが変更されたかどうかを判断するため）
+        # データの識別子（データが変更されたかどうかを判断するため）
         if self.processed_data is not None:
-            # データフレームのサイズと列名のハッシュを使用
-            data_hash = hash((len(self.processed_data), tuple(self.processed_data.columns)))
-            key_parts.append(f"data:{data_hash}")
+            # 処理済みデータフレームのオブジェクト識別子を使用
+            # （行数と列名だけでは別のフィルタ結果を区別できないため）
+            key_parts.append(f"data:{id(self.processed_data)}")
 
         return ":".join(key_parts)
 
@@ -118,8 +140,10 @@ class DataProcessor:
         if column not in self.data.columns:
             raise ValueError(f"フィルタ列 '{column}' がデータに存在しません。")
 
-        # フィルター条件が変更された場合はキャッシュを無効化
+        # フィルター条件が変更された場合のみマスクを再計算してキャッシュを無効化
+        # （変更のない列のマスクはキャッシュをそのまま使う）
         if column not in self.filter_columns or self.filter_columns[column] != value:
+            self._filter_masks[column] = np.isclose(self.data[column].to_numpy(), value)
             self._invalidate_cache()
 
         self.filter_columns[column] = value
@@ -136,9 +160,11 @@ class DataProcessor:
             if self.filter_columns:
                 self._invalidate_cache()
             self.filter_columns.clear()
+            self._filter_masks.clear()
         elif column in self.filter_columns:
             self._invalidate_cache()
             del self.filter_columns[column]
+            self._filter_masks.pop(column, None)
 
     def process_data(self) -> pd.DataFrame:
         """
@@ -157,13 +183,19 @@ class DataProcessor:
         # フィルタリング条件の適用（ベクトル化処理）
         if not self.filter_columns:
             # フィルタリング条件がない場合は元のデータをそのまま使用
+            # （同じオブジェクトのままならキャッシュも有効なので再利用する）
+            if self.processed_data is self.data:
+                return self.processed_data
             self.processed_data = self.data
         else:
-            # すべてのフィルタリング条件を一度に適用するマスクを作成
-            mask = np.ones(len(self.data), dtype=bool)
+            # キャッシュ済みの列ごとのマスクをまとめて適用
+            # （set_data直後などマスクがない列のみ再計算する）
             for column, value in self.filter_columns.items():
-                # 近似値でフィルタリング（完全一致だと浮動小数点の誤差で問題が発生する可能性がある）
-                mask &= np.isclose(self.data[column].values, value)
+                if column not in self._filter_masks:
+                    # 近似値でフィルタリング（完全一致だと浮動小数点の誤差で問題が発生する可能性がある）
+                    self._filter_masks[column] = np.isclose(self.data[column].to_numpy(), value)
+
+            mask = np.logical_and.reduce(list(self._filter_masks.values()))
 
             # マスクを適用してフィルタリング
             self.processed_data = self.data[mask]
@@ -179,7 +211,8 @@ class DataProcessor:
         NumPyのベクトル化処理とキャッシュを使用して高速化しています。
 
         Returns:
-            Tuple[np.ndarray, np.ndarray, np.ndarray]: (X軸の値, Y軸の値, Z軸の値)
+            Tuple[np.ndarray, np.ndarray, np.ndarray]:
+                (X軸の値の1次元配列, Y軸の値の1次元配列, Z値の2次元配列)
         """
         if self.processed_data is None or len(self.processed_data) == 0:
             raise ValueError("処理済みデータが存在しません。")
@@ -195,35 +228,33 @@ class DataProcessor:
             return self._cache[cache_key]
 
         # ユニークなX軸、Y軸の値を取得（ソート済み）
-        x_values = np.array(sorted(self.processed_data[self.x_column].unique()))
-        y_values = np.array(sorted(self.processed_data[self.y_column].unique()))
-
-        # メッシュグリッドの作成
-        X, Y = np.meshgrid(x_values, y_values)
+        # sorted()はPythonリスト経由で要素をボックス化してしまうため、
+        # ネイティブdtypeのままCレベルでソートできるnp.sortを使用する
+        x_values = np.sort(np.asarray(self.processed_data[self.x_column].unique()))
+        y_values = np.sort(np.asarray(self.processed_data[self.y_column].unique()))
 
         # Z値の初期化（NaNで埋める）
-        Z = np.full(X.shape, np.nan)
+        # メッシュグリッドは作成しない（pcolormeshは1次元のX/Yを受け付けるため、
+        # len(x)×len(y)の2次元配列を2つ確保するメモリを節約できる）
+        # 表示用途にはfloat32の精度で十分なので、float64の半分のメモリで済ませる
+        Z = np.full((len(y_values), len(x_values)), np.nan, dtype=np.float32)
 
         # データポイントをマッピング（ベクトル化処理）
         # 1. 各データポイントのx, y, z値を抽出
-        x_data = self.processed_data[self.x_column].values
-        y_data = self.processed_data[self.y_column].values
-        z_data = self.processed_data[self.value_column].values
-
-        # 2. x値とy値のインデックスを高速に検索するための辞書を作成
-        x_indices = {val: i for i, val in enumerate(x_values)}
-        y_indices = {val: i for i, val in enumerate(y_values)}
+        x_data = self.processed_data[self.x_column].to_numpy()
+        y_data = self.processed_data[self.y_column].to_numpy()
+        z_data = self.processed_data[self.value_column].to_numpy(dtype=np.float32)
 
-        # 3. 各データポイントのインデックスを取得
-        x_idx = np.array([x_indices.get(x, -1) for x in x_data])
-        y_idx = np.array([y_indices.get(y, -1) for y in y_data])
+        # 2. ソート済みのユニーク値配列に対する各データポイントの位置を二分探索で取得
+        #    （x_values/y_valuesは同じ列のユニーク値なので、必ず一致する位置が見つかる）
+        x_idx = np.searchsorted(x_values, x_data)
+        y_idx = np.searchsorted(y_values, y_data)
 
-        # 4. 有効なインデックスのみを使用してZ値を設定
-        valid_indices = (x_idx >= 0) & (y_idx >= 0)
-        Z[y_idx[valid_indices], x_idx[valid_indices]] = z_data[valid_indices]
+        # 3. Z値を一括設定
+        Z[y_idx, x_idx] = z_data
 
         # 結果をキャッシュに保存
-        result = (X, Y, Z)
+        result = (x_values, y_values, Z)
         self._cache[cache_key] = result
 
         return result
@@ -284,20 +315,20 @@ class DataProcessor:
             return self._cache[cache_key]
 
         # 最も近いY座標値を持つデータを抽出
-        y_data = self.processed_data[self.y_column].values
+        y_data = self.processed_data[self.y_column].to_numpy()
         closest_y_idx = np.abs(y_data - y_value).argmin()
         closest_y = y_data[closest_y_idx]
 
         # 該当するY座標のデータを抽出
-        mask = np.isclose(self.processed_data[self.y_column].values, closest_y)
+        mask = np.isclose(self.processed_data[self.y_column].to_numpy(), closest_y)
         profile_data = self.processed_data[mask]
 
         # X座標でソート
         profile_data = profile_data.sort_values(by=self.x_column)
 
         # X座標と値を取得
-        x_coords = profile_data[self.x_column].values
-        values = profile_data[self.value_column].values
+        x_coords = profile_data[self.x_column].to_numpy()
+        values = profile_data[self.value_column].to_numpy()
 
         # 結果をキャッシュに保存
         result = (x_coords, values)
@@ -330,20 +361,20 @@ class DataProcessor:
             return self._cache[cache_key]
 
         # 最も近いX座標値を持つデータを抽出
-        x_data = self.processed_data[self.x_column].values
+        x_data = self.processed_data[self.x_column].to_numpy()
         closest_x_idx = np.abs(x_data - x_value).argmin()
         closest_x = x_data[closest_x_idx]
 
         # 該当するX座標のデータを抽出
-        mask = np.isclose(self.processed_data[self.x_column].values, closest_x)
+        mask = np.isclose(self.processed_data[self.x_column].to_numpy(), closest_x)
         profile_data = self.processed_data[mask]
 
         # Y座標でソート
         profile_data = profile_data.sort_values(by=self.y_column)
 
         # Y座標と値を取得
-        y_coords = profile_data[self.y_column].values
-        values = profile_data[self.value_column].values
+        y_coords = profile_data[self.y_column].to_numpy()
+        values = profile_data[self.value_column].to_numpy()
 
         # 結果をキャッシュに保存
         result = (y_coords, values)
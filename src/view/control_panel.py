@@ -4,10 +4,75 @@
 軸選択、フィルタリングなどのコントロールを提供します。
 """
 
+from functools import partial
 import tkinter as tk
 from tkinter import ttk
 from tkinter import messagebox
 
+import numpy as np
+
+
+class RangeVars:
+    """
+    表示範囲の6値をまとめて保持するヘルパークラス
+
+    値ごとにtk.DoubleVarを作るとTcl変数オブジェクトとトレースが
+    その個数分インタプリタ側に生成されるため、1つのTcl配列変数の
+    要素として保持し、Entryのtextvariableには配列要素名を渡します。
+    """
+
+    KEYS = ("x_min", "x_max", "y_min", "y_max", "value_min", "value_max")
+
+    def __init__(self, widget, array_name="::cp_ranges"):
+        """
+        RangeVarsの初期化
+
+        Args:
+            widget: Tclインタプリタへのアクセスに使用するウィジェット
+            array_name (str): Tcl配列変数の名前
+        """
+        self._tk = widget.tk
+        self._name = array_name
+        for key in self.KEYS:
+            self._tk.call("set", self.var(key), 0.0)
+
+    def var(self, key):
+        """
+        Entryのtextvariableに渡す配列要素名を返します。
+
+        Args:
+            key (str): 要素名（KEYSのいずれか）
+
+        Returns:
+            str: Tcl配列要素の変数名
+        """
+        return f"{self._name}({key})"
+
+    def get(self, key):
+        """
+        範囲値の取得
+
+        Args:
+            key (str): 要素名（KEYSのいずれか）
+
+        Returns:
+            float: 現在の値
+
+        Raises:
+            tkinter.TclError: 数値として解釈できない入力の場合
+        """
+        return self._tk.getdouble(self._tk.call("set", self.var(key)))
+
+    def set(self, key, value):
+        """
+        範囲値の設定
+
+        Args:
+            key (str): 要素名（KEYSのいずれか）
+            value (float): 設定する値
+        """
+        self._tk.call("set", self.var(key), value)
+
 
 class ControlPanel:
     """
@@ -16,6 +81,11 @@ class ControlPanel:
     軸選択、フィルタリングなどのコントロールを提供します。
     """
 
+    # フィルタ値ドロップダウンに一度に表示する候補数の上限
+    # （Tkはvaluesの全要素を内部リストボックスに展開するため、
+    # ユニーク値が数千あるとリストの構築だけでUIが固まる）
+    FILTER_COMBO_MAX = 200
+
     def __init__(self, parent, controller):
         """
         コントロールパネルの初期化
@@ -38,13 +108,35 @@ class ControlPanel:
         self.log_scale = tk.BooleanVar(value=False)   # デフォルトは線形スケール
         self.file_format = tk.StringVar(value="auto")  # デフォルトは自動検出
 
-        # 表示範囲
-        self.x_min = tk.DoubleVar()
-        self.x_max = tk.DoubleVar()
-        self.y_min = tk.DoubleVar()
-        self.y_max = tk.DoubleVar()
-        self.value_min = tk.DoubleVar()
-        self.value_max = tk.DoubleVar()
+        # フィルタリスト表示用の行ウィジェットプール
+        self._filter_row_pool = []
+
+        # 前回表示したフィルタ行（列名と表示テキストの組）のリスト
+        # （差分のある行だけを更新するための比較用）
+        self._last_filter_rows = []
+
+        # スクロール領域更新の予約フラグ
+        self._scrollregion_pending = False
+        self._filter_scrollregion_pending = False
+
+        # フィルタ列ごとの集計結果（ソート済み値と最小・最大値）のキャッシュ
+        self._filter_value_cache = {}
+
+        # 選択中のフィルタ列のソート済み全ユニーク値
+        # （ドロップダウンには先頭FILTER_COMBO_MAX件のみを表示し、
+        # 入力に応じてここから絞り込む）
+        self._all_filter_values = []
+
+        # 最後にコントローラーへ適用した軸とカラーマップ
+        # （選択が変わっていない場合の再プロットを省くため）
+        self._last_axes = None
+        self._last_colormap = None
+
+        # 遅延構築パネルが構築済みかどうか
+        self._deferred_built = False
+
+        # 表示範囲（6値を1つのTcl配列にまとめて保持）
+        self.ranges = RangeVars(parent)
 
         self._create_widgets()
 
@@ -55,9 +147,39 @@ class ControlPanel:
         Args:
             event: イベント情報
         """
-        # キャンバスのスクロール領域を更新
+        # スクロール領域の更新をアイドル時に1回だけ実行するようスケジュール
+        # （ウィジェット構築中は<Configure>が連続して発生し、bbox("all")の
+        # 走査が毎回走ってしまうため）
+        if self._scrollregion_pending:
+            return
+        self._scrollregion_pending = True
+        self.canvas.after_idle(self._flush_scrollregion)
+
+    def _flush_scrollregion(self):
+        """キャンバスのスクロール領域を更新します。"""
+        self._scrollregion_pending = False
         self.canvas.configure(scrollregion=self.canvas.bbox("all"))
 
+    def _schedule_filter_scrollregion(self, event=None):
+        """
+        フィルタリストキャンバスのスクロール領域更新を予約します。
+
+        フィルタ行の配置・非表示のたびに<Configure>が発生するため、
+        _on_frame_configureと同様にアイドル時に1回だけ更新します。
+
+        Args:
+            event: イベント情報（未使用）
+        """
+        if self._filter_scrollregion_pending:
+            return
+        self._filter_scrollregion_pending = True
+        self.filter_canvas.after_idle(self._flush_filter_scrollregion)
+
+    def _flush_filter_scrollregion(self):
+        """フィルタリストキャンバスのスクロール領域を更新します。"""
+        self._filter_scrollregion_pending = False
+        self.filter_canvas.configure(scrollregion=self.filter_canvas.bbox("all"))
+
     def _on_canvas_configure(self, event):
         """
         キャンバスサイズが変更されたときの処理
@@ -68,31 +190,154 @@ class ControlPanel:
         # キャンバス内のフレームの幅を調整
         self.canvas.itemconfig(self.canvas_window, width=event.width)
 
-    def _on_mousewheel(self, event):
+    def _on_mousewheel(self, event, canvas=None):
         """
         マウスホイール操作時の処理
 
         Args:
             event: イベント情報
+            canvas: スクロール対象のキャンバス（Noneの場合はメインキャンバス）
         """
+        if canvas is None:
+            canvas = self.canvas
+
         # マウスホイールの方向に応じてスクロール
         # Windows: event.delta, macOS: event.num
         if event.delta:
             # Windows
-            self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+            canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
         elif event.num == 4:
             # Linux: マウスホイール上回転
-            self.canvas.yview_scroll(-1, "units")
+            canvas.yview_scroll(-1, "units")
         elif event.num == 5:
             # Linux: マウスホイール下回転
-            self.canvas.yview_scroll(1, "units")
+            canvas.yview_scroll(1, "units")
+
+    def _enable_mousewheel(self, canvas):
+        """
+        キャンバスをマウスホイール配送の対象として登録します。
+
+        ホイールイベントはMainWindowがルートで一括受信し、ポインタ直下の
+        ウィジェットから親をたどって最初に見つかったwheel_handlerに配送
+        します。パネルごとに<Enter>/<Leave>でbind_all/unbind_allを
+        張り替える必要がなくなります。
+
+        Args:
+            canvas: スクロール対象のキャンバス
+        """
+        canvas.wheel_handler = partial(self._on_mousewheel, canvas=canvas)
+
+    def _is_float(self, text):
+        """
+        数値入力用Entryのキー入力検証を行います。
+
+        Args:
+            text (str): 入力後のEntryの内容全体
+
+        Returns:
+            bool: 数値として妥当（入力途中の形を含む）ならTrue
+        """
+        # 入力途中の形（空欄や符号・小数点のみ）を許可
+        if text in ("", "-", "+", ".", "-.", "+."):
+            return True
+
+        try:
+            float(text)
+            return True
+        except ValueError:
+            pass
+
+        # 指数表記の入力途中（"1e" や "1e-" など）を許可
+        for suffix in ("e-", "e+", "E-", "E+", "e", "E"):
+            if text.endswith(suffix):
+                try:
+                    float(text[:-len(suffix)])
+                    return True
+                except ValueError:
+                    return False
+        return False
+
+    def _batch_update(self, fn):
+        """
+        複数のウィジェット更新を1回の再描画にまとめて実行します。
+
+        更新中は内側フレームの<Configure>ハンドラを外してスクロール領域の
+        再計算を抑制し、最後に1回だけスクロール領域を更新します。
+
+        Args:
+            fn (callable): まとめて実行する更新処理
+        """
+        self.frame.unbind("<Configure>")
+        try:
+            fn()
+        finally:
+            self.frame.bind("<Configure>", self._on_frame_configure)
+            self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+
+    def _build_combo_row(self, parent, label_text, textvariable=None):
+        """
+        ラベル付きコンボボックスの行を作成して配置します。
+
+        同じ「ラベル＋コンボボックス」構成の行が多数あるため、生成処理を
+        1か所にまとめてウィジェット構築コードの重複を減らします。
+
+        Args:
+            parent: 親ウィジェット
+            label_text (str): ラベルの文字列
+            textvariable: コンボボックスに紐づける変数
+
+        Returns:
+            ttk.Combobox: 作成したコンボボックス
+        """
+        row = ttk.Frame(parent)
+        row.pack(fill=tk.X, pady=2)
+        ttk.Label(row, text=label_text).pack(side=tk.LEFT, padx=5)
+        combo = ttk.Combobox(row, textvariable=textvariable, state="readonly")
+        combo.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        return combo
+
+    def _build_entry_row(self, parent, label_text, textvariable=None, numeric=False):
+        """
+        ラベル付き入力フィールドの行を作成して配置します。
+
+        Args:
+            parent: 親ウィジェット
+            label_text (str): ラベルの文字列
+            textvariable: 入力フィールドに紐づける変数
+            numeric (bool): Trueの場合は数値のキー入力検証を有効化
+
+        Returns:
+            ttk.Entry: 作成した入力フィールド
+        """
+        row = ttk.Frame(parent)
+        row.pack(fill=tk.X, pady=2)
+        ttk.Label(row, text=label_text).pack(side=tk.LEFT, padx=5)
+        if numeric:
+            entry = ttk.Entry(row, textvariable=textvariable,
+                              validate="key", validatecommand=self._float_vcmd)
+        else:
+            entry = ttk.Entry(row, textvariable=textvariable)
+        entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        return entry
 
     def _create_widgets(self):
         """ウィジェットの作成"""
-        # 外側のフレーム
-        self.outer_frame = ttk.Frame(self.parent)
+        # 起動時にはスクロール枠・ファイル形式・軸設定のみを構築する
+        # （フィルタ・表示オプション・表示範囲のパネルはデータを読み込むまで
+        # 使われないため、初回のupdate_columnsまで構築を遅延する）
+        self._create_core_widgets()
+
+        # ウィジェットツリーの構築が終わってからスクロール領域の監視を開始し、
+        # 外側フレームを一度だけ配置する（構築中のpackごとに<Configure>→
+        # bbox("all")の再計算とリフローが走るのを防ぐ）
+        self.frame.bind("<Configure>", self._on_frame_configure)
         self.outer_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
+    def _create_core_widgets(self):
+        """基本ウィジェット（スクロール枠・ファイル形式・軸設定）の作成"""
+        # 外側のフレーム（配置は構築完了後に行う）
+        self.outer_frame = ttk.Frame(self.parent)
+
         # スクロール可能なキャンバスを作成
         self.canvas = tk.Canvas(self.outer_frame)
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -106,14 +351,13 @@ class ControlPanel:
         self.frame = ttk.Frame(self.canvas)
         self.canvas_window = self.canvas.create_window((0, 0), window=self.frame, anchor=tk.NW)
 
-        # フレームサイズが変更されたときにキャンバスのスクロール領域を更新
-        self.frame.bind("<Configure>", self._on_frame_configure)
+        # キャンバスサイズに内側フレームの幅を追従させる
+        # （内側フレームの<Configure>は構築完了後にバインドする）
         self.canvas.bind("<Configure>", self._on_canvas_configure)
 
         # マウスホイールでのスクロールを有効化
-        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)  # Windows
-        self.canvas.bind_all("<Button-4>", self._on_mousewheel)    # Linux/macOS
-        self.canvas.bind_all("<Button-5>", self._on_mousewheel)    # Linux/macOS
+        # （ポインタがキャンバス上にある間のみ）
+        self._enable_mousewheel(self.canvas)
 
         # タイトル
         title_label = ttk.Label(self.frame, text="コントロールパネル", font=("", 12, "bold"))
@@ -128,11 +372,7 @@ class ControlPanel:
         format_frame.pack(fill=tk.X, pady=5)
 
         # ファイル形式選択
-        format_select_frame = ttk.Frame(format_frame)
-        format_select_frame.pack(fill=tk.X, pady=2)
-        ttk.Label(format_select_frame, text="形式:").pack(side=tk.LEFT, padx=5)
-        self.format_combo = ttk.Combobox(format_select_frame, textvariable=self.file_format, state="readonly")
-        self.format_combo.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        self.format_combo = self._build_combo_row(format_frame, "形式:", self.file_format)
         self.format_combo["values"] = ("自動検出", "標準CSV", "Sample2形式", "Sample3形式")
         self.format_combo.current(0)
 
@@ -144,29 +384,16 @@ class ControlPanel:
         axis_frame = ttk.LabelFrame(self.frame, text="軸設定")
         axis_frame.pack(fill=tk.X, pady=5)
 
-        # X軸選択
-        x_frame = ttk.Frame(axis_frame)
-        x_frame.pack(fill=tk.X, pady=2)
-        ttk.Label(x_frame, text="X軸:").pack(side=tk.LEFT, padx=5)
-        self.x_combo = ttk.Combobox(x_frame, textvariable=self.x_column, state="readonly")
-        self.x_combo.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
-        self.x_combo.bind("<<ComboboxSelected>>", self._on_axis_change)
-
-        # Y軸選択
-        y_frame = ttk.Frame(axis_frame)
-        y_frame.pack(fill=tk.X, pady=2)
-        ttk.Label(y_frame, text="Y軸:").pack(side=tk.LEFT, padx=5)
-        self.y_combo = ttk.Combobox(y_frame, textvariable=self.y_column, state="readonly")
-        self.y_combo.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
-        self.y_combo.bind("<<ComboboxSelected>>", self._on_axis_change)
-
-        # 値選択
-        value_frame = ttk.Frame(axis_frame)
-        value_frame.pack(fill=tk.X, pady=2)
-        ttk.Label(value_frame, text="値:").pack(side=tk.LEFT, padx=5)
-        self.value_combo = ttk.Combobox(value_frame, textvariable=self.value_column, state="readonly")
-        self.value_combo.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
-        self.value_combo.bind("<<ComboboxSelected>>", self._on_axis_change)
+        # 軸選択（属性名・ラベル・変数の定義から一括で構築）
+        axis_rows = (
+            ("x_combo", "X軸:", self.x_column),
+            ("y_combo", "Y軸:", self.y_column),
+            ("value_combo", "値:", self.value_column),
+        )
+        for attr, label_text, var in axis_rows:
+            combo = self._build_combo_row(axis_frame, label_text, var)
+            combo.bind("<<ComboboxSelected>>", self._on_axis_change)
+            setattr(self, attr, combo)
 
         # 軸入れ替えボタン
         swap_button = ttk.Button(axis_frame, text="X軸とY軸を入れ替え", command=self._on_swap_axes)
@@ -176,16 +403,30 @@ class ControlPanel:
         separator = ttk.Separator(self.frame, orient=tk.HORIZONTAL)
         separator.pack(fill=tk.X, pady=5)
 
+    def _create_deferred_widgets(self):
+        """データ読み込み後に必要になるパネル群の作成"""
+        # 数値入力用のキー検証コマンド
+        # （ボタン押下時のtry/exceptではなく入力時点で不正値を弾く）
+        self._float_vcmd = (self.parent.register(self._is_float), "%P")
+
+        self._create_filter_widgets()
+        self._create_display_widgets()
+        self._create_range_widgets()
+
+        # リセットボタン
+        reset_button = ttk.Button(self.frame, text="表示をリセット", command=self._on_reset)
+        reset_button.pack(fill=tk.X, padx=5, pady=5)
+
+        self._deferred_built = True
+
+    def _create_filter_widgets(self):
+        """フィルタリングパネルの作成"""
         # フィルタリングフレーム
         filter_frame = ttk.LabelFrame(self.frame, text="フィルタリング")
         filter_frame.pack(fill=tk.X, pady=5)
 
         # フィルタ列選択
-        filter_col_frame = ttk.Frame(filter_frame)
-        filter_col_frame.pack(fill=tk.X, pady=2)
-        ttk.Label(filter_col_frame, text="フィルタ列:").pack(side=tk.LEFT, padx=5)
-        self.filter_combo = ttk.Combobox(filter_col_frame, textvariable=self.filter_column, state="readonly")
-        self.filter_combo.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        self.filter_combo = self._build_combo_row(filter_frame, "フィルタ列:", self.filter_column)
         self.filter_combo.bind("<<ComboboxSelected>>", self._on_filter_column_change)
 
         # フィルタタイプ選択
@@ -202,18 +443,12 @@ class ControlPanel:
         self.value_filter_frame.pack(fill=tk.X, pady=2)
 
         # 値選択用ドロップダウン
-        dropdown_frame = ttk.Frame(self.value_filter_frame)
-        dropdown_frame.pack(fill=tk.X, pady=2)
-        ttk.Label(dropdown_frame, text="値を選択:").pack(side=tk.LEFT, padx=5)
-        self.filter_value_combo = ttk.Combobox(dropdown_frame, state="readonly")
-        self.filter_value_combo.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        self.filter_value_combo = self._build_combo_row(self.value_filter_frame, "値を選択:")
 
         # 値入力用フィールド
-        entry_frame = ttk.Frame(self.value_filter_frame)
-        entry_frame.pack(fill=tk.X, pady=2)
-        ttk.Label(entry_frame, text="値を入力:").pack(side=tk.LEFT, padx=5)
-        self.filter_value_entry = ttk.Entry(entry_frame)
-        self.filter_value_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        # （入力内容を前方一致でドロップダウンの候補の絞り込みにも使う）
+        self.filter_value_entry = self._build_entry_row(self.value_filter_frame, "値を入力:")
+        self.filter_value_entry.bind("<KeyRelease>", self._on_filter_entry_keyrelease)
 
         # 範囲フィルタフレーム
         self.range_filter_frame = ttk.Frame(filter_frame)
@@ -221,20 +456,14 @@ class ControlPanel:
         self.range_filter_frame.pack_forget()  # 初期状態では非表示
 
         # 最小値
-        min_frame = ttk.Frame(self.range_filter_frame)
-        min_frame.pack(fill=tk.X, pady=2)
-        ttk.Label(min_frame, text="最小値:").pack(side=tk.LEFT, padx=5)
         self.filter_min_value = tk.DoubleVar()
-        self.filter_min_entry = ttk.Entry(min_frame, textvariable=self.filter_min_value)
-        self.filter_min_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        self.filter_min_entry = self._build_entry_row(
+            self.range_filter_frame, "最小値:", self.filter_min_value, numeric=True)
 
         # 最大値
-        max_frame = ttk.Frame(self.range_filter_frame)
-        max_frame.pack(fill=tk.X, pady=2)
-        ttk.Label(max_frame, text="最大値:").pack(side=tk.LEFT, padx=5)
         self.filter_max_value = tk.DoubleVar()
-        self.filter_max_entry = ttk.Entry(max_frame, textvariable=self.filter_max_value)
-        self.filter_max_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        self.filter_max_entry = self._build_entry_row(
+            self.range_filter_frame, "最大値:", self.filter_max_value, numeric=True)
 
         # フィルタ追加ボタン
         filter_button_frame = ttk.Frame(filter_frame)
@@ -256,12 +485,12 @@ class ControlPanel:
         filter_scrollbar = ttk.Scrollbar(filter_canvas_frame, orient=tk.VERTICAL, command=self.filter_canvas.yview)
         filter_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.filter_canvas.configure(yscrollcommand=filter_scrollbar.set)
+        self._enable_mousewheel(self.filter_canvas)
 
         # フィルタリストを表示するフレーム
         self.filter_list_inner_frame = ttk.Frame(self.filter_canvas)
         self.filter_canvas.create_window((0, 0), window=self.filter_list_inner_frame, anchor=tk.NW)
-        self.filter_list_inner_frame.bind("<Configure>", lambda e: self.filter_canvas.configure(
-            scrollregion=self.filter_canvas.bbox("all")))
+        self.filter_list_inner_frame.bind("<Configure>", self._schedule_filter_scrollregion)
 
         # すべてクリアボタン
         clear_button_frame = ttk.Frame(filter_frame)
@@ -273,16 +502,14 @@ class ControlPanel:
         separator = ttk.Separator(self.frame, orient=tk.HORIZONTAL)
         separator.pack(fill=tk.X, pady=5)
 
+    def _create_display_widgets(self):
+        """表示オプションパネルの作成"""
         # 表示オプションフレーム
         display_frame = ttk.LabelFrame(self.frame, text="表示オプション")
         display_frame.pack(fill=tk.X, pady=5)
 
         # カラーマップ選択
-        colormap_frame = ttk.Frame(display_frame)
-        colormap_frame.pack(fill=tk.X, pady=2)
-        ttk.Label(colormap_frame, text="カラーマップ:").pack(side=tk.LEFT, padx=5)
-        self.colormap_combo = ttk.Combobox(colormap_frame, textvariable=self.colormap, state="readonly")
-        self.colormap_combo.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        self.colormap_combo = self._build_combo_row(display_frame, "カラーマップ:", self.colormap)
         self.colormap_combo["values"] = ("plasma", "viridis", "jet", "hot", "cool", "gray")
         self.colormap_combo.current(0)
         self.colormap_combo.bind("<<ComboboxSelected>>", self._on_colormap_change)
@@ -309,6 +536,8 @@ class ControlPanel:
         separator = ttk.Separator(self.frame, orient=tk.HORIZONTAL)
         separator.pack(fill=tk.X, pady=5)
 
+    def _create_range_widgets(self):
+        """表示範囲パネルの作成"""
         # 表示範囲フレーム
         range_frame = ttk.LabelFrame(self.frame, text="表示範囲")
         range_frame.pack(fill=tk.X, pady=5)
@@ -317,30 +546,36 @@ class ControlPanel:
         x_range_frame = ttk.Frame(range_frame)
         x_range_frame.pack(fill=tk.X, pady=2)
         ttk.Label(x_range_frame, text="X範囲:").pack(side=tk.LEFT, padx=5)
-        self.x_min_entry = ttk.Entry(x_range_frame, textvariable=self.x_min, width=8)
+        self.x_min_entry = ttk.Entry(x_range_frame, textvariable=self.ranges.var("x_min"), width=8,
+                                     validate="key", validatecommand=self._float_vcmd)
         self.x_min_entry.pack(side=tk.LEFT, padx=2)
         ttk.Label(x_range_frame, text="～").pack(side=tk.LEFT)
-        self.x_max_entry = ttk.Entry(x_range_frame, textvariable=self.x_max, width=8)
+        self.x_max_entry = ttk.Entry(x_range_frame, textvariable=self.ranges.var("x_max"), width=8,
+                                     validate="key", validatecommand=self._float_vcmd)
         self.x_max_entry.pack(side=tk.LEFT, padx=2)
 
         # Y軸範囲
         y_range_frame = ttk.Frame(range_frame)
         y_range_frame.pack(fill=tk.X, pady=2)
         ttk.Label(y_range_frame, text="Y範囲:").pack(side=tk.LEFT, padx=5)
-        self.y_min_entry = ttk.Entry(y_range_frame, textvariable=self.y_min, width=8)
+        self.y_min_entry = ttk.Entry(y_range_frame, textvariable=self.ranges.var("y_min"), width=8,
+                                     validate="key", validatecommand=self._float_vcmd)
         self.y_min_entry.pack(side=tk.LEFT, padx=2)
         ttk.Label(y_range_frame, text="～").pack(side=tk.LEFT)
-        self.y_max_entry = ttk.Entry(y_range_frame, textvariable=self.y_max, width=8)
+        self.y_max_entry = ttk.Entry(y_range_frame, textvariable=self.ranges.var("y_max"), width=8,
+                                     validate="key", validatecommand=self._float_vcmd)
         self.y_max_entry.pack(side=tk.LEFT, padx=2)
 
         # 値範囲
         value_range_frame = ttk.Frame(range_frame)
         value_range_frame.pack(fill=tk.X, pady=2)
         ttk.Label(value_range_frame, text="値範囲:").pack(side=tk.LEFT, padx=5)
-        self.value_min_entry = ttk.Entry(value_range_frame, textvariable=self.value_min, width=8)
+        self.value_min_entry = ttk.Entry(value_range_frame, textvariable=self.ranges.var("value_min"), width=8,
+                                     validate="key", validatecommand=self._float_vcmd)
         self.value_min_entry.pack(side=tk.LEFT, padx=2)
         ttk.Label(value_range_frame, text="～").pack(side=tk.LEFT)
-        self.value_max_entry = ttk.Entry(value_range_frame, textvariable=self.value_max, width=8)
+        self.value_max_entry = ttk.Entry(value_range_frame, textvariable=self.ranges.var("value_max"), width=8,
+                                     validate="key", validatecommand=self._float_vcmd)
         self.value_max_entry.pack(side=tk.LEFT, padx=2)
 
         # 範囲適用ボタン
@@ -351,10 +586,6 @@ class ControlPanel:
         separator = ttk.Separator(self.frame, orient=tk.HORIZONTAL)
         separator.pack(fill=tk.X, pady=5)
 
-        # リセットボタン
-        reset_button = ttk.Button(self.frame, text="表示をリセット", command=self._on_reset)
-        reset_button.pack(fill=tk.X, padx=5, pady=5)
-
     def update_columns(self, columns):
         """
         列リストの更新
@@ -364,18 +595,35 @@ class ControlPanel:
         """
         self.columns = columns
 
-        # コンボボックスの更新
-        self.x_combo["values"] = columns
-        self.y_combo["values"] = columns
-        self.value_combo["values"] = columns
-        self.filter_combo["values"] = columns
+        # 新しいデータセットではフィルタ値のキャッシュは無効
+        self._filter_value_cache.clear()
+
+        # 軸の選択履歴もリセットする
+        # （新しいファイルで以前と同じ軸を選び直してもset_axesが
+        # スキップされないようにする）
+        self._last_axes = None
+
+        # 遅延構築していたパネルを初回のデータ読み込み時に構築
+        # （構築中のスクロール領域再計算を抑制するためバッチ実行する）
+        if not self._deferred_built:
+            self._batch_update(self._create_deferred_widgets)
+
+        def apply():
+            # コンボボックスの更新
+            self.x_combo["values"] = columns
+            self.y_combo["values"] = columns
+            self.value_combo["values"] = columns
+            self.filter_combo["values"] = columns
 
-        # デフォルト値の設定
-        if len(columns) >= 3:
-            self.x_combo.current(0)
-            self.y_combo.current(1)
-            self.value_combo.current(2)
-            self.filter_combo.current(0)
+            # デフォルト値の設定
+            if len(columns) >= 3:
+                self.x_combo.current(0)
+                self.y_combo.current(1)
+                self.value_combo.current(2)
+                self.filter_combo.current(0)
+
+        # 再描画を1回にまとめて実行
+        self._batch_update(apply)
 
     def update_filter_values(self, values, is_numeric):
         """
@@ -391,29 +639,50 @@ class ControlPanel:
         # 数値列かどうかを記録
         self.is_numeric_column = is_numeric
 
-        # ドロップダウンの値を更新
-        sorted_values = sorted(values)
-        self.filter_value_combo["values"] = sorted_values
-        if sorted_values:
-            self.filter_value_combo.current(0)
-
-        if is_numeric:
-            # 数値列の場合
-            min_val = min(values)
-            max_val = max(values)
-
-            # 範囲フィルタの初期値を設定
-            self.filter_min_value.set(min_val)
-            self.filter_max_value.set(max_val)
+        # 列ごとの集計結果をキャッシュ
+        # （同じ列を選び直したときにソートとmin/maxの再計算を省く。
+        # ソート済みなので最小・最大は両端から読むだけでよい）
+        column = self.filter_column.get()
+        cached = self._filter_value_cache.get(column)
+        if cached is None:
+            if is_numeric:
+                # 数値列はNumPyでソート
+                # （C実装のイントロソートで、要素ごとのPythonオブジェクト比較が
+                # 発生するsorted()よりユニーク値が多い列で大幅に速い）
+                arr = np.asarray(list(values), dtype=float)
+                arr.sort()
+                cached = (arr.tolist(), float(arr[0]), float(arr[-1]))
+            else:
+                sorted_values = sorted(values)
+                cached = (sorted_values, None, None)
+            self._filter_value_cache[column] = cached
+        sorted_values, min_val, max_val = cached
+
+        def apply():
+            # ドロップダウンの値を更新
+            # （全件をvaluesに渡すとTkが内部リストボックスに全要素を展開して
+            # しまうため、表示は先頭FILTER_COMBO_MAX件に制限する）
+            self._all_filter_values = sorted_values
+            self.filter_value_combo["values"] = tuple(sorted_values[:self.FILTER_COMBO_MAX])
+            if sorted_values:
+                self.filter_value_combo.current(0)
+
+            if is_numeric:
+                # 範囲フィルタの初期値を設定
+                self.filter_min_value.set(min_val)
+                self.filter_max_value.set(max_val)
+
+                # 入力フィールドの初期値を設定
+                self.filter_value_entry.delete(0, tk.END)
+                self.filter_value_entry.insert(0, str(min_val))
+            else:
+                # 非数値列の場合は範囲フィルタを無効化
+                if self.filter_type.get() == "range":
+                    self.filter_type.set("value")
+                    self._on_filter_type_change()
 
-            # 入力フィールドの初期値を設定
-            self.filter_value_entry.delete(0, tk.END)
-            self.filter_value_entry.insert(0, str(min_val))
-        else:
-            # 非数値列の場合は範囲フィルタを無効化
-            if self.filter_type.get() == "range":
-                self.filter_type.set("value")
-                self._on_filter_type_change()
+        # 再描画を1回にまとめて実行
+        self._batch_update(apply)
 
     def update_ranges(self, x_range, y_range, value_range):
         """
@@ -425,16 +694,16 @@ class ControlPanel:
             value_range (tuple): 値の範囲 (min, max)
         """
         # X軸範囲
-        self.x_min.set(x_range[0])
-        self.x_max.set(x_range[1])
+        self.ranges.set("x_min", x_range[0])
+        self.ranges.set("x_max", x_range[1])
 
         # Y軸範囲
-        self.y_min.set(y_range[0])
-        self.y_max.set(y_range[1])
+        self.ranges.set("y_min", y_range[0])
+        self.ranges.set("y_max", y_range[1])
 
         # 値範囲
-        self.value_min.set(value_range[0])
-        self.value_max.set(value_range[1])
+        self.ranges.set("value_min", value_range[0])
+        self.ranges.set("value_max", value_range[1])
 
     def _on_axis_change(self, event):
         """
@@ -443,17 +712,21 @@ class ControlPanel:
         Args:
             event: イベント情報
         """
+        axes = (self.x_column.get(), self.y_column.get(), self.value_column.get())
+
+        # 選択が変わっていない場合は何もしない
+        # （コンボボックスを開いて同じ項目を選び直しただけで再プロットが走るのを防ぐ）
+        if axes == self._last_axes:
+            return
+
         # 同じ列が選択されていないか確認
-        if self.x_column.get() == self.y_column.get():
+        if axes[0] == axes[1]:
             messagebox.showwarning("警告", "X軸とY軸に同じ列を選択することはできません。")
             return
 
         # コントローラーに通知
-        self.controller.set_axes(
-            self.x_column.get(),
-            self.y_column.get(),
-            self.value_column.get()
-        )
+        self._last_axes = axes
+        self.controller.set_axes(*axes)
 
     def _on_swap_axes(self):
         """軸入れ替え時の処理"""
@@ -465,11 +738,37 @@ class ControlPanel:
         self.y_column.set(x_val)
 
         # コントローラーに通知
-        self.controller.set_axes(
-            self.x_column.get(),
-            self.y_column.get(),
-            self.value_column.get()
-        )
+        axes = (self.x_column.get(), self.y_column.get(), self.value_column.get())
+        self._last_axes = axes
+        self.controller.set_axes(*axes)
+
+    def _on_filter_entry_keyrelease(self, event=None):
+        """
+        値入力フィールドの内容でドロップダウンの候補を絞り込みます。
+
+        ソート済み全ユニーク値から前方一致するものをFILTER_COMBO_MAX件
+        まで集めてvaluesに設定します。数値列は数値順でソートされていて
+        文字列の辞書順とは一致しないため、二分探索ではなく上限付きの
+        線形走査で探します。
+
+        Args:
+            event: イベント情報（未使用）
+        """
+        if not self._all_filter_values:
+            return
+
+        prefix = self.filter_value_entry.get().strip()
+        if not prefix:
+            matched = self._all_filter_values[:self.FILTER_COMBO_MAX]
+        else:
+            matched = []
+            for value in self._all_filter_values:
+                if str(value).startswith(prefix):
+                    matched.append(value)
+                    if len(matched) >= self.FILTER_COMBO_MAX:
+                        break
+
+        self.filter_value_combo["values"] = tuple(matched)
 
     def _on_filter_column_change(self, event):
         """
@@ -481,24 +780,33 @@ class ControlPanel:
         # コントローラーに通知
         self.controller.update_filter_values(self.filter_column.get())
 
-    def _on_filter_type_change(self):
-        """フィルタタイプ変更時の処理"""
-        filter_type = self.filter_type.get()
+    def _apply_filter_type(self, filter_type):
+        """
+        フィルタタイプに応じて入力フレームの表示を切り替えます。
 
+        Args:
+            filter_type (str): "value"（値フィルタ）または"range"（範囲フィルタ）
+        """
         if filter_type == "value":
-            # 値フィルタを表示
             self.value_filter_frame.pack(fill=tk.X, pady=2)
             self.range_filter_frame.pack_forget()
         else:
-            # 範囲フィルタを表示（数値列の場合のみ）
-            if hasattr(self, 'is_numeric_column') and self.is_numeric_column:
-                self.value_filter_frame.pack_forget()
-                self.range_filter_frame.pack(fill=tk.X, pady=2)
-            else:
-                # 非数値列の場合は値フィルタに戻す
-                self.filter_type.set("value")
-                messagebox.showwarning("警告", "範囲フィルタは数値列のみ使用できます。")
-                self._on_filter_type_change()
+            self.value_filter_frame.pack_forget()
+            self.range_filter_frame.pack(fill=tk.X, pady=2)
+
+    def _on_filter_type_change(self):
+        """フィルタタイプ変更時の処理"""
+        filter_type = self.filter_type.get()
+
+        # 範囲フィルタは数値列の場合のみ使用可能
+        if filter_type == "range" and not (hasattr(self, 'is_numeric_column') and self.is_numeric_column):
+            # 非数値列の場合は値フィルタに戻す
+            # （再帰呼び出しせず、表示の切り替えを1回だけ行う）
+            self.filter_type.set("value")
+            messagebox.showwarning("警告", "範囲フィルタは数値列のみ使用できます。")
+            filter_type = "value"
+
+        self._apply_filter_type(filter_type)
 
     def _on_add_filter(self):
         """フィルタ追加時の処理"""
@@ -553,8 +861,10 @@ class ControlPanel:
                 # コントローラーに通知
                 self.controller.add_range_filter(column, min_val, max_val)
 
-            # フィルタリストを更新
-            self._update_filter_list()
+            # フィルタリストの更新はフィルタ適用の完了後に
+            # コントローラー側からupdate_filter_listで行われる
+            # （適用はワーカースレッドで非同期に実行されるため、ここで
+            # 更新すると変更前の状態を表示してしまう）
 
         except Exception as e:
             messagebox.showerror("エラー", str(e))
@@ -562,47 +872,62 @@ class ControlPanel:
     def _on_clear_filters(self):
         """すべてのフィルタをクリア"""
         # コントローラーに通知
+        # （フィルタリストはクリア完了後にコントローラー側から更新される）
         self.controller.clear_filters()
 
-        # フィルタリストを更新
-        self._update_filter_list()
-
-    def _update_filter_list(self):
+    def update_filter_list(self):
         """フィルタリストの更新"""
-        # 既存のフィルタリストをクリア
-        for widget in self.filter_list_inner_frame.winfo_children():
-            widget.destroy()
+        # フィルタパネルが未構築（データ未読み込み）の場合は何もしない
+        if not self._deferred_built:
+            return
 
         # フィルタ情報を取得
         filter_summary = self.controller.get_filter_summary()
 
-        # 値フィルタの表示
+        # 表示する行（列名と表示テキストの組）を作成
+        rows = []
         for column, value in filter_summary["value_filters"].items():
-            filter_frame = ttk.Frame(self.filter_list_inner_frame)
-            filter_frame.pack(fill=tk.X, pady=1)
+            rows.append((column, f"{column} = {value}"))
+        for column, (min_val, max_val) in filter_summary["range_filters"].items():
+            rows.append((column, f"{column} = {min_val:.6g}～{max_val:.6g}"))
 
-            # フィルタ情報のラベル
-            filter_text = f"{column} = {value}"
-            ttk.Label(filter_frame, text=filter_text).pack(side=tk.LEFT, padx=5)
+        # 前回と同じ内容なら何もしない
+        if rows == self._last_filter_rows:
+            return
 
-            # 削除ボタン
-            delete_button = ttk.Button(filter_frame, text="×", width=2,
-                                       command=lambda col=column: self._on_delete_filter(col))
-            delete_button.pack(side=tk.RIGHT, padx=5)
+        # 既存の行ウィジェットを再利用して更新
+        # （毎回destroy/再生成するとTclの往復とテーマ処理が行数分発生するため。
+        # さらに前回と内容が同じ行はconfigureもpackもせずそのまま使う）
+        for i, (column, text) in enumerate(rows):
+            if i < len(self._last_filter_rows) and self._last_filter_rows[i] == (column, text):
+                continue
+            if i < len(self._filter_row_pool):
+                filter_frame, label, delete_button = self._filter_row_pool[i]
+                label.configure(text=text)
+                delete_button.configure(command=partial(self._on_delete_filter, column))
+                filter_frame.pack(fill=tk.X, pady=1)
+            else:
+                filter_frame = ttk.Frame(self.filter_list_inner_frame)
+                filter_frame.pack(fill=tk.X, pady=1)
 
-        # 範囲フィルタの表示
-        for column, (min_val, max_val) in filter_summary["range_filters"].items():
-            filter_frame = ttk.Frame(self.filter_list_inner_frame)
-            filter_frame.pack(fill=tk.X, pady=1)
+                # フィルタ情報のラベル
+                label = ttk.Label(filter_frame, text=text)
+                label.pack(side=tk.LEFT, padx=5)
+
+                # 削除ボタン
+                delete_button = ttk.Button(filter_frame, text="×", width=2,
+                                           command=partial(self._on_delete_filter, column))
+                delete_button.pack(side=tk.RIGHT, padx=5)
+
+                self._filter_row_pool.append((filter_frame, label, delete_button))
 
-            # フィルタ情報のラベル
-            filter_text = f"{column} = {min_val:.6g}～{max_val:.6g}"
-            ttk.Label(filter_frame, text=filter_text).pack(side=tk.LEFT, padx=5)
+        # 余った行は破棄せず非表示にしてプールに残す
+        # （destroyはTclの往復と親への<Configure>を伴うため、次回の追加に備えて
+        # ウィジェットを使い回す。前回表示していた行だけを非表示にすればよい）
+        for filter_frame, label, delete_button in self._filter_row_pool[len(rows):len(self._last_filter_rows)]:
+            filter_frame.pack_forget()
 
-            # 削除ボタン
-            delete_button = ttk.Button(filter_frame, text="×", width=2,
-                                       command=lambda col=column: self._on_delete_filter(col))
-            delete_button.pack(side=tk.RIGHT, padx=5)
+        self._last_filter_rows = rows
 
         # キャンバスの更新
         self.filter_canvas.update_idletasks()
@@ -616,11 +941,9 @@ class ControlPanel:
             column (str): 削除するフィルタの列名
         """
         # コントローラーに通知
+        # （フィルタリストは削除完了後にコントローラー側から更新される）
         self.controller.clear_filters(column)
 
-        # フィルタリストを更新
-        self._update_filter_list()
-
     def _on_colormap_change(self, event):
         """
         カラーマップ変更時の処理
@@ -628,8 +951,15 @@ class ControlPanel:
         Args:
             event: イベント情報
         """
+        colormap = self.colormap.get()
+
+        # 選択が変わっていない場合は何もしない
+        if colormap == self._last_colormap:
+            return
+
         # コントローラーに通知
-        self.controller.set_colormap(self.colormap.get())
+        self._last_colormap = colormap
+        self.controller.set_colormap(colormap)
 
     def _on_scale_change(self):
         """スケール変更時の処理"""
@@ -640,12 +970,14 @@ class ControlPanel:
         """範囲適用時の処理"""
         try:
             # 入力値の取得
-            x_min = float(self.x_min.get())
-            x_max = float(self.x_max.get())
-            y_min = float(self.y_min.get())
-            y_max = float(self.y_max.get())
-            value_min = float(self.value_min.get())
-            value_max = float(self.value_max.get())
+            # （RangeVars.get()はfloatを返すためfloat()での再変換は不要。
+            # 空欄などの不正な入力はValueErrorではなくTclErrorになる点に注意）
+            x_min = self.ranges.get("x_min")
+            x_max = self.ranges.get("x_max")
+            y_min = self.ranges.get("y_min")
+            y_max = self.ranges.get("y_max")
+            value_min = self.ranges.get("value_min")
+            value_max = self.ranges.get("value_max")
 
             # 範囲の妥当性チェック
             if x_min >= x_max:
@@ -662,6 +994,8 @@ class ControlPanel:
                 (value_min, value_max)
             )
 
+        except tk.TclError:
+            messagebox.showerror("エラー", "範囲には数値を入力してください。")
         except ValueError as e:
             messagebox.showerror("エラー", str(e))
 
@@ -6,7 +6,6 @@
 
 from .status_bar import StatusBar
 from .control_panel import ControlPanel
-from .plot_panel import PlotPanel
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import matplotlib
@@ -33,9 +32,18 @@ class MainWindow:
         self.root.geometry("1200x800")
         self.root.minsize(800, 600)
 
+        # 構築中はウィンドウを非表示にする
+        # （表示したまま構築するとウィジェットのpackごとに<Configure>と
+        # 中間状態の描画が発生するため、組み上がってから一度だけ表示する）
+        self.root.withdraw()
+
         self._create_menu()
         self._create_layout()
 
+        # レイアウト計算を済ませてから表示
+        self.root.update_idletasks()
+        self.root.deiconify()
+
         # ウィンドウが閉じられたときの処理
         self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
 
@@ -85,10 +93,57 @@ class MainWindow:
         self.status_frame.pack(fill=tk.X, padx=5, pady=2)
 
         # 各コンポーネントの作成
+        # （プロットパネルはmatplotlibのFigureとTkキャンバスの生成が
+        # 起動時間の大部分を占めるため、最初の描画まで構築を遅延する）
         self.control_panel = ControlPanel(self.control_frame, self.controller)
-        self.plot_panel = PlotPanel(self.plot_frame, self.controller)
+        self.plot_panel = None
         self.status_bar = StatusBar(self.status_frame)
 
+        # マウスホイールイベントはルートで一括受信し、ポインタ直下の
+        # スクロール対象に配送する（パネルごとにbind_allを張り替えると
+        # バインドの付け外しが発生するうえ、複数パネルで競合する）
+        self.root.bind_all("<MouseWheel>", self._route_wheel)  # Windows
+        self.root.bind_all("<Button-4>", self._route_wheel)    # Linux/macOS
+        self.root.bind_all("<Button-5>", self._route_wheel)    # Linux/macOS
+
+    def _route_wheel(self, event):
+        """
+        マウスホイールイベントをポインタ直下のスクロール対象に配送します。
+
+        ポインタ位置のウィジェットから親をたどり、最初に見つかった
+        wheel_handler属性（各パネルが登録する）を呼び出します。
+
+        Args:
+            event: イベント情報
+        """
+        widget = self.root.winfo_containing(event.x_root, event.y_root)
+        while widget is not None:
+            handler = getattr(widget, "wheel_handler", None)
+            if handler is not None:
+                handler(event)
+                return
+            widget = widget.master
+
+    def ensure_plot_panel(self):
+        """
+        プロットパネルを必要になった時点で構築して返します。
+
+        初回呼び出し時にPlotPanelを構築し、構築前にコントロールパネルで
+        変更されていた表示設定をパネルに反映します。
+
+        Returns:
+            PlotPanel: プロットパネル
+        """
+        if self.plot_panel is None:
+            from .plot_panel import PlotPanel
+            self.plot_panel = PlotPanel(self.plot_frame, self.controller)
+
+            # 構築前に選択された表示設定を反映
+            self.plot_panel.colormap = self.control_panel.colormap.get()
+            self.plot_panel.log_scale = self.control_panel.log_scale.get()
+
+        return self.plot_panel
+
     def run(self):
         """アプリケーションの実行"""
         self.root.mainloop()
@@ -146,6 +201,17 @@ class MainWindow:
         """
         self.status_bar.set_message(message)
 
+    def update_coords(self, x, y, value=None):
+        """
+        ステータスバーの座標表示の更新
+
+        Args:
+            x (float): X座標
+            y (float): Y座標
+            value (float, optional): 座標位置のデータ値
+        """
+        self.status_bar.set_coords_xy(x, y, value)
+
     def show_error(self, title, message):
         """
         エラーメッセージの表示
@@ -4,7 +4,8 @@
 matplotlibを使用したプロット表示を提供します。
 """
 
-from matplotlib.colors import LogNorm
+from matplotlib.colors import LogNorm, Normalize
+from matplotlib.patches import Rectangle
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 from matplotlib.figure import Figure
 import tkinter as tk
@@ -40,6 +41,24 @@ class PlotPanel:
         self.colormap = 'plasma'  # デフォルトのカラーマップ
         self.log_scale = False    # デフォルトは線形スケール
         self.colorbar = None      # カラーバーの参照
+        self.im = None            # ヒートマップのアーティストの参照
+        self._grid_steps = None   # 等間隔格子の刻み幅 (dx, dy)（不等間隔の場合はNone）
+
+        # マウス移動イベントの間引き用の状態
+        self._motion_pending = False
+        self._pending_xy = None
+
+        # z_dataの集計値（正の最小値・最小値・最大値）のキャッシュ
+        # （カラーマップやスケールの切り替えのたびに全要素を走査しないよう、
+        # データが差し替わるまで結果を使い回す。計算元の配列への参照を
+        # 保持し、is比較で差し替えを検出する）
+        self._z_src = None
+        self._z_limits_cache = None
+
+        # ドラッグによる範囲選択の状態
+        self._selection_rect = None  # 選択矩形のアーティスト
+        self._drag_start = None      # ドラッグ開始座標 (x, y)
+        self._bg = None              # ブリッティング用の背景スナップショット
         self.profile_mode = False  # 断面表示モード
 
         self._create_widgets()
@@ -54,68 +73,134 @@ class PlotPanel:
         self.figure = Figure(figsize=(6, 5), dpi=100)
         self.ax = self.figure.add_subplot(111)
 
-        # キャンバスの作成
+        # キャンバスとツールバーの作成
+        # （ツールバーを先に下側へ配置し、キャンバスのpackは1回で済ませる。
+        # 2回packするとTkのジオメトリ管理が再実行される）
         self.canvas = FigureCanvasTkAgg(self.figure, self.frame)
         self.canvas.draw()
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-
-        # ツールバーの作成
         self.toolbar = NavigationToolbar2Tk(self.canvas, self.frame)
         self.toolbar.update()
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.toolbar.pack(side=tk.BOTTOM, fill=tk.X)
+        self.canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True)
 
         # マウスイベントの設定
-        self.canvas.mpl_connect('motion_notify_event', self._on_motion)
-        self.canvas.mpl_connect('button_press_event', self._on_click)
-        self.canvas.mpl_connect('draw_event', self._on_draw)
+        # （接続はここで一度だけ行う。plot_heatmapで再接続すると描画の
+        # たびにハンドラが重複登録され、イベント処理が描画回数に比例して
+        # 遅くなっていく。接続IDは解除が必要になった場合に備えて保持する）
+        self._cids = [
+            self.canvas.mpl_connect('motion_notify_event', self._on_motion),
+            self.canvas.mpl_connect('button_press_event', self._on_click),
+            self.canvas.mpl_connect('button_release_event', self._on_release),
+            self.canvas.mpl_connect('draw_event', self._on_draw),
+        ]
+
+    @staticmethod
+    def _is_uniform(values):
+        """
+        1次元配列が等間隔に並んでいるかどうかを判定します。
+
+        Args:
+            values (numpy.ndarray): 判定する1次元配列
+
+        Returns:
+            bool: 等間隔の場合はTrue
+        """
+        if values is None or len(values) < 2:
+            return False
+        diffs = np.diff(values)
+        return bool(np.allclose(diffs, diffs[0]))
 
     def plot_heatmap(self, x_data, y_data, z_data, x_label, y_label, title=None, vmin=None, vmax=None):
         """
         ヒートマップの描画
 
         Args:
-            x_data (numpy.ndarray): X軸のデータ
-            y_data (numpy.ndarray): Y軸のデータ
-            z_data (numpy.ndarray): Z軸のデータ（カラーマップの値）
+            x_data (numpy.ndarray): X軸のデータ（1次元）
+            y_data (numpy.ndarray): Y軸のデータ（1次元）
+            z_data (numpy.ndarray): Z軸のデータ（カラーマップの値、2次元）
             x_label (str): X軸のラベル
             y_label (str): Y軸のラベル
             title (str, optional): プロットのタイトル
             vmin (float, optional): カラーマップの最小値
             vmax (float, optional): カラーマップの最大値
         """
+        # 倍精度データは描画前に単精度へ落とす
+        # （カラーマップは8bit RGBAに変換されるため表示にはfloat32で十分で、
+        # 正規化→RGBA変換パイプラインの転送量が半分になる。値表示の%.6gにも
+        # float32の約7桁で足りる）
+        if z_data.dtype == np.float64:
+            z_data = z_data.astype(np.float32, copy=False)
+
         self.x_data = x_data
         self.y_data = y_data
         self.z_data = z_data
 
-        # Figureを完全にクリア
-        self.figure.clear()
+        # カーソル位置検索用の格子刻み
+        # （間引き前のフル解像度の軸から求める）
+        if self._is_uniform(x_data) and self._is_uniform(y_data):
+            self._grid_steps = (x_data[1] - x_data[0], y_data[1] - y_data[0])
+        else:
+            self._grid_steps = None
 
-        # 新しいAxesを作成
-        self.ax = self.figure.add_subplot(111)
+        # 表示ピクセル数を大きく超えるデータは描画前にブロック平均で縮小する
+        # （カーソル位置の値表示にはフル解像度のself.z_dataを使うので精度は落ちない）
+        x_data, y_data, z_data = self._downsample(x_data, y_data, z_data)
+
+        # Axesのみをクリア
+        # （figure.clear()はカラーバーの軸ごと破棄してしまい、作り直しに
+        # レイアウト計算とティッカー構築のコストが毎回かかる）
+        self.ax.clear()
+        self._selection_rect = None  # クリアで破棄された選択矩形への参照を捨てる
 
         # カラーマップの設定
         if self.log_scale:
             # 対数スケールの場合、0以下の値を扱えないため、最小値を調整
             if vmin is not None and vmin <= 0:
-                vmin = z_data[z_data > 0].min() if z_data.size > 0 else 1e-10
+                vmin = self._z_limits()[0]
             if vmax is not None and vmax <= 0:
-                vmax = z_data.max()
+                vmax = self._z_limits()[2]
             norm = LogNorm(vmin=vmin, vmax=vmax)
         else:
             norm = None
 
         # ヒートマップの描画
-        im = self.ax.pcolormesh(
-            x_data, y_data, z_data,
-            cmap=self.colormap,
-            norm=norm,
-            vmin=vmin if not self.log_scale else None,
-            vmax=vmax if not self.log_scale else None,
-            shading='auto'
-        )
+        # （ラスタスキャン由来の等間隔格子の場合は、セルごとに四角形を
+        # 構築するpcolormeshではなく、1枚の画像として転送できるimshowで
+        # 描画する。頂点数がセル数×4から画素数だけになり大幅に速い）
+        if self._is_uniform(x_data) and self._is_uniform(y_data):
+            dx = x_data[1] - x_data[0]
+            dy = y_data[1] - y_data[0]
+            extent = (x_data[0] - dx / 2, x_data[-1] + dx / 2,
+                      y_data[0] - dy / 2, y_data[-1] + dy / 2)
+            im = self.ax.imshow(
+                z_data,
+                extent=extent,
+                origin='lower',
+                aspect='auto',
+                interpolation='nearest',
+                cmap=self.colormap,
+                norm=norm,
+                vmin=vmin if not self.log_scale else None,
+                vmax=vmax if not self.log_scale else None
+            )
+        else:
+            im = self.ax.pcolormesh(
+                x_data, y_data, z_data,
+                cmap=self.colormap,
+                norm=norm,
+                vmin=vmin if not self.log_scale else None,
+                vmax=vmax if not self.log_scale else None,
+                shading='auto',
+                rasterized=True  # PDF/SVG保存時にセルごとのベクタ図形ではなく1枚の画像として埋め込む
+            )
+        self.im = im
 
         # カラーバーの追加と参照の保持
-        self.colorbar = self.figure.colorbar(im, ax=self.ax, label='電流値')
+        # （2回目以降は既存のカラーバーを新しいアーティストに付け替えるだけ）
+        if self.colorbar is None:
+            self.colorbar = self.figure.colorbar(im, ax=self.ax, label='電流値')
+        else:
+            self.colorbar.update_normal(im)
 
         # 軸ラベルの設定
         self.ax.set_xlabel(x_label)
@@ -126,16 +211,56 @@ class PlotPanel:
             self.ax.set_title(title)
 
         # グリッドの表示
-        self.ax.grid(True, linestyle='--', alpha=0.7)
-
-        # マウスイベントの再設定
-        self.canvas.mpl_connect('button_press_event', self._on_click)
-        self.canvas.mpl_connect('motion_notify_event', self._on_motion)
-        self.canvas.mpl_connect('draw_event', self._on_draw)
+        # （セル数が多いヒートマップでは破線＋半透明の合成処理が再描画の
+        # たびに全面に走るわりに視認上の意味がないため、粗いデータのみ表示）
+        if z_data.size < 10000:
+            self.ax.grid(True, linestyle='--', alpha=0.7)
 
         # キャンバスの更新
+        # （マウスイベントは_create_widgetsで一度だけ接続済み。ここで
+        # 再接続すると描画のたびにハンドラが重複登録されてしまう）
         self.canvas.draw()
 
+    def update_heatmap(self, z_data, vmin=None, vmax=None):
+        """
+        値のみが変わったヒートマップを既存アーティストの更新で再描画します。
+
+        ストリーミング計測のように形状と軸が同じままz_dataだけが更新される
+        場合に、Figure・Axes・カラーバーを作り直さずデータ転送だけで済ませ
+        ます。形状や軸が変わる場合はplot_heatmapを使用してください。
+
+        Args:
+            z_data (numpy.ndarray): 新しいZ軸のデータ（形状は前回と同じ）
+            vmin (float, optional): カラーマップの最小値
+            vmax (float, optional): カラーマップの最大値
+        """
+        if self.im is None or self.z_data is None or z_data.shape != self.z_data.shape:
+            # アーティスト未作成または形状変更時は通常の描画経路で処理する
+            self.plot_heatmap(
+                self.x_data, self.y_data, z_data,
+                self.ax.get_xlabel(), self.ax.get_ylabel(),
+                self.ax.get_title(),
+                vmin=vmin, vmax=vmax
+            )
+            return
+
+        if z_data.dtype == np.float64:
+            z_data = z_data.astype(np.float32, copy=False)
+        self.z_data = z_data
+
+        # 描画中のアーティストと同じ解像度に縮小してから転送する
+        _, _, z_plot = self._downsample(self.x_data, self.y_data, z_data)
+        if hasattr(self.im, 'set_data'):
+            self.im.set_data(z_plot)       # imshow（AxesImage）
+        else:
+            self.im.set_array(z_plot)      # pcolormesh（QuadMesh）
+
+        if vmin is not None or vmax is not None:
+            self.im.set_clim(vmin, vmax)
+
+        self.colorbar.update_normal(self.im)
+        self.canvas.draw_idle()
+
     def set_profile_mode(self, enabled):
         """
         断面表示モードの設定
@@ -159,20 +284,18 @@ class PlotPanel:
             colormap (str): カラーマップ名
         """
         self.colormap = colormap
-        if self.z_data is not None:
-            # 現在の値範囲を取得
-            vmin = vmax = None
-            if self.colorbar is not None:
-                vmin = self.colorbar.norm.vmin if hasattr(self.colorbar.norm, 'vmin') else None
-                vmax = self.colorbar.norm.vmax if hasattr(self.colorbar.norm, 'vmax') else None
+        if self.z_data is None:
+            return
 
-            self.plot_heatmap(
-                self.x_data, self.y_data, self.z_data,
-                self.ax.get_xlabel(), self.ax.get_ylabel(),
-                self.ax.get_title(),
-                vmin=vmin,
-                vmax=vmax
-            )
+        if self.im is not None:
+            # 既存のアーティストのカラーマップだけを差し替える
+            # （plot_heatmapによるFigure全体の再構築はカラーバーや軸の
+            # 作り直しを伴い、切り替えのたびに数百msかかる）
+            self.im.set_cmap(colormap)
+            self.colorbar.update_normal(self.im)
+            self.canvas.draw_idle()
+        else:
+            self._replot()
 
     def set_scale(self, log_scale):
         """
@@ -182,20 +305,46 @@ class PlotPanel:
             log_scale (bool): 対数スケールの場合はTrue、線形スケールの場合はFalse
         """
         self.log_scale = log_scale
-        if self.z_data is not None:
-            # 現在の値範囲を取得
-            vmin = vmax = None
-            if self.colorbar is not None:
-                vmin = self.colorbar.norm.vmin if hasattr(self.colorbar.norm, 'vmin') else None
-                vmax = self.colorbar.norm.vmax if hasattr(self.colorbar.norm, 'vmax') else None
+        if self.z_data is None:
+            return
 
-            self.plot_heatmap(
-                self.x_data, self.y_data, self.z_data,
-                self.ax.get_xlabel(), self.ax.get_ylabel(),
-                self.ax.get_title(),
-                vmin=vmin,
-                vmax=vmax
-            )
+        if self.im is not None:
+            # 既存のアーティストのノルムだけを差し替える
+            # （vmin/vmaxは現在のノルムから引き継ぎ、set_rangesで設定された
+            # 値の範囲をスケール切り替えでリセットしないようにする）
+            vmin = self.im.norm.vmin
+            vmax = self.im.norm.vmax
+            if log_scale:
+                # 対数スケールは0以下の値を扱えないため、0以下の境界だけ
+                # データの正の最小値・最大値で置き換える
+                pos_min, _, z_max = self._z_limits()
+                if vmin is None or vmin <= 0:
+                    vmin = pos_min
+                if vmax is None or vmax <= 0:
+                    vmax = z_max
+                norm = LogNorm(vmin=vmin, vmax=vmax)
+            else:
+                norm = Normalize(vmin=vmin, vmax=vmax)
+            self.im.set_norm(norm)
+            self.colorbar.update_normal(self.im)
+            self.canvas.draw_idle()
+        else:
+            self._replot()
+
+    def _replot(self):
+        """現在のデータと軸ラベルでヒートマップを再描画します。"""
+        vmin = vmax = None
+        if self.colorbar is not None:
+            vmin = self.colorbar.norm.vmin if hasattr(self.colorbar.norm, 'vmin') else None
+            vmax = self.colorbar.norm.vmax if hasattr(self.colorbar.norm, 'vmax') else None
+
+        self.plot_heatmap(
+            self.x_data, self.y_data, self.z_data,
+            self.ax.get_xlabel(), self.ax.get_ylabel(),
+            self.ax.get_title(),
+            vmin=vmin,
+            vmax=vmax
+        )
 
     def _on_draw(self, event):
         """
@@ -229,10 +378,173 @@ class PlotPanel:
                 self.controller.show_profiles(click_point)
             return
 
+        # 左ドラッグで関心領域の選択を開始
+        # （ツールバーのズーム・パンモード中はそちらに任せる）
+        if event.button == 1 and not self.toolbar.mode and self.z_data is not None:
+            self._start_selection(event)
+            return
+
         # 右クリックの場合はリセット
         if event.button == 3:
             self.controller.reset_view()
 
+    def _start_selection(self, event):
+        """
+        ドラッグによる範囲選択を開始します。
+
+        Args:
+            event: マウスイベント
+        """
+        self._drag_start = (event.xdata, event.ydata)
+
+        # 選択矩形の作成（animated=Trueで通常の描画対象から外し、
+        # ブリッティングでのみ描画する）
+        if self._selection_rect is None:
+            self._selection_rect = Rectangle(
+                self._drag_start, 0, 0,
+                fill=False, edgecolor='red', linestyle='--', linewidth=1,
+                animated=True
+            )
+            self.ax.add_patch(self._selection_rect)
+        else:
+            self._selection_rect.set_xy(self._drag_start)
+            self._selection_rect.set_width(0)
+            self._selection_rect.set_height(0)
+
+        # 背景を1回だけスナップショットしておき、ドラッグ中は
+        # 復元＋矩形描画＋blitだけで済ませる（ヒートマップの再描画を避ける）
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+
+    def _update_selection(self, event):
+        """
+        ドラッグ中の選択矩形を更新します。
+
+        Args:
+            event: マウスイベント
+        """
+        x0, y0 = self._drag_start
+        self._selection_rect.set_width(event.xdata - x0)
+        self._selection_rect.set_height(event.ydata - y0)
+
+        # ブリッティングで矩形のみを再描画
+        self.canvas.restore_region(self._bg)
+        self.ax.draw_artist(self._selection_rect)
+        self.canvas.blit(self.ax.bbox)
+
+    def _on_release(self, event):
+        """
+        マウスボタンを離したときの処理（選択範囲へのズーム）
+
+        Args:
+            event: マウスイベント
+        """
+        if self._drag_start is None:
+            return
+
+        x0, y0 = self._drag_start
+        self._drag_start = None
+        self._bg = None
+
+        # 軸の外で離した場合やドラッグ量がわずかな場合はズームしない
+        if event.inaxes != self.ax or event.xdata is None:
+            self.canvas.draw_idle()
+            return
+
+        x1, y1 = event.xdata, event.ydata
+        x_span = abs(np.diff(self.ax.get_xlim())[0])
+        y_span = abs(np.diff(self.ax.get_ylim())[0])
+        if abs(x1 - x0) < 0.01 * x_span or abs(y1 - y0) < 0.01 * y_span:
+            self.canvas.draw_idle()
+            return
+
+        # 選択範囲に拡大（表示範囲の変更は_on_draw経由でコントローラーに通知される）
+        # 矩形はここで破棄し、両軸の変更をまとめて1回のdraw_idleで反映する
+        self.ax.set_xlim(sorted((x0, x1)))
+        self.ax.set_ylim(sorted((y0, y1)))
+        if self._selection_rect is not None:
+            self._selection_rect.remove()
+            self._selection_rect = None
+        self.canvas.draw_idle()
+
+    def _downsample(self, x_data, y_data, z_data):
+        """
+        表示ピクセル数に対して過剰なデータをブロック平均で縮小します。
+
+        4096×4096のデータを600×500程度のキャンバスに描いても画素数以上の
+        情報は表示できないため、各次元を表示ピクセル数の2倍程度まで
+        縮小してから描画します。縮小不要な場合は入力をそのまま返します。
+
+        Args:
+            x_data (numpy.ndarray): X軸のデータ（1次元）
+            y_data (numpy.ndarray): Y軸のデータ（1次元）
+            z_data (numpy.ndarray): Z軸のデータ（2次元）
+
+        Returns:
+            tuple: 縮小後の (x_data, y_data, z_data)
+        """
+        widget = self.canvas.get_tk_widget()
+        width = widget.winfo_width()
+        height = widget.winfo_height()
+        if width <= 1 or height <= 1:
+            # ウィジェットが未配置の間はFigureのサイズから推定する
+            width, height = (self.figure.get_size_inches() * self.figure.dpi).astype(int)
+
+        rows, cols = z_data.shape
+        sy = max(1, rows // (height * 2))
+        sx = max(1, cols // (width * 2))
+        if sx == 1 and sy == 1:
+            return x_data, y_data, z_data
+
+        # ブロック平均で縮小（端数の行・列は切り捨てる）
+        new_rows = rows // sy
+        new_cols = cols // sx
+        z = z_data[:new_rows * sy, :new_cols * sx].reshape(new_rows, sy, new_cols, sx)
+        z = np.nanmean(z, axis=(1, 3))
+        x = x_data[:new_cols * sx].reshape(new_cols, sx).mean(axis=1)
+        y = y_data[:new_rows * sy].reshape(new_rows, sy).mean(axis=1)
+        return x, y, z
+
+    def _z_limits(self):
+        """
+        z_dataの正の最小値・最小値・最大値を返します。
+
+        ブールマスクでの抽出コピーを作らずwhere付きのリダクションで計算し、
+        同じデータに対する再計算はキャッシュで省きます。
+
+        Returns:
+            tuple: (正の最小値, 最小値, 最大値)
+        """
+        if self._z_src is not self.z_data:
+            z = self.z_data
+            pos_min = np.min(z, where=z > 0, initial=np.inf)
+            if not np.isfinite(pos_min):
+                pos_min = 1e-10
+            self._z_limits_cache = (
+                float(pos_min),
+                float(np.nanmin(z)),
+                float(np.nanmax(z)),
+            )
+            self._z_src = self.z_data
+        return self._z_limits_cache
+
+    @staticmethod
+    def _nearest_index(axis, value):
+        """
+        ソート済みの軸配列から値に最も近い要素のインデックスを返します。
+
+        Args:
+            axis (numpy.ndarray): ソート済みの1次元配列
+            value (float): 探す値
+
+        Returns:
+            int: 最も近い要素のインデックス
+        """
+        i = int(np.searchsorted(axis, value))
+        i = min(max(i, 1), len(axis) - 1)
+        if (axis[i] - value) < (value - axis[i - 1]):
+            return i
+        return i - 1
+
     def _on_motion(self, event):
         """
         マウス移動時の処理
@@ -240,16 +552,47 @@ class PlotPanel:
         Args:
             event: マウスイベント
         """
-        if event.inaxes != self.ax:
+        if event.inaxes != self.ax or self.z_data is None:
             return
 
-        # カーソル位置の値を表示
-        if self.z_data is not None:
-            # 最も近いデータポイントを探す
-            x_idx = np.abs(self.x_data[0, :] - event.xdata).argmin()
-            y_idx = np.abs(self.y_data[:, 0] - event.ydata).argmin()
+        # 範囲選択のドラッグ中は矩形の更新のみを行う
+        if self._drag_start is not None:
+            self._update_selection(event)
+            return
 
-            if 0 <= x_idx < self.z_data.shape[1] and 0 <= y_idx < self.z_data.shape[0]:
-                value = self.z_data[y_idx, x_idx]
-                status_text = f"X: {event.xdata:.6g}, Y: {event.ydata:.6g}, 値: {value:.6g}"
-                self.controller.update_status(status_text)
+        # 最新の座標だけを保持し、表示の更新はアイドル時にまとめて行う
+        # （移動イベントは1ピクセルごとに発生するため、毎回ステータスバーを
+        # 更新するとTk側の描画が追いつかずUIが遅延する）
+        self._pending_xy = (event.xdata, event.ydata)
+        if not self._motion_pending:
+            self._motion_pending = True
+            self.canvas.get_tk_widget().after_idle(self._flush_motion)
+
+    def _flush_motion(self):
+        """間引いたマウス移動イベントの最新座標でステータスバーを更新します。"""
+        self._motion_pending = False
+        if self._pending_xy is None or self.z_data is None:
+            return
+        xdata, ydata = self._pending_xy
+
+        # 最も近いデータポイントを探す
+        # （軸はソート済みなので、全要素との差分を取るargminではなく
+        # 等間隔格子なら刻み幅から直接、そうでなければ二分探索で求める）
+        if self._grid_steps is not None:
+            dx, dy = self._grid_steps
+            x_idx = int(round((xdata - self.x_data[0]) / dx))
+            y_idx = int(round((ydata - self.y_data[0]) / dy))
+        else:
+            x_idx = self._nearest_index(self.x_data, xdata)
+            y_idx = self._nearest_index(self.y_data, ydata)
+
+        if 0 <= x_idx < self.z_data.shape[1] and 0 <= y_idx < self.z_data.shape[0]:
+            # 最寄りのデータ点の座標と値を座標表示欄に出す
+            # （カーソル位置そのものではなく格子点にスナップした座標を渡す
+            # ことで、同じセル上にいる間はキャッシュ済みの文字列が使い回され、
+            # ステータスバー側の同一文字列チェックでTclへの書き込みも省ける）
+            self.controller.update_coords(
+                float(self.x_data[x_idx]),
+                float(self.y_data[y_idx]),
+                float(self.z_data[y_idx, x_idx]),
+            )
@@ -73,6 +73,26 @@ class ProfileWindow:
         self.y_toolbar = NavigationToolbar2Tk(self.y_canvas, self.y_frame)
         self.y_toolbar.update()
 
+    @staticmethod
+    def _nearest(arr, value):
+        """
+        ソート済み配列から値に最も近い要素のインデックスを返します。
+
+        全要素との差分を取るargminではなく二分探索で求めます。
+
+        Args:
+            arr (array): ソート済みの1次元配列
+            value (float): 探す値
+
+        Returns:
+            int: 最も近い要素のインデックス
+        """
+        i = int(np.searchsorted(arr, value))
+        i = min(max(i, 1), len(arr) - 1)
+        if abs(arr[i] - value) < abs(arr[i - 1] - value):
+            return i
+        return i - 1
+
     def plot_profiles(self, x_data, x_values, y_data, y_values, click_point, x_label, y_label, value_label):
         """
         断面プロットの描画
@@ -99,8 +119,10 @@ class ProfileWindow:
         self.x_ax.grid(True)
 
         # クリックした点をマーク
-        idx = np.abs(x_data - click_point[0]).argmin()
-        if idx < len(x_values):
+        # （最寄り点が1格子分以上離れている場合＝範囲外クリックはマークしない）
+        idx = self._nearest(x_data, click_point[0])
+        tol = np.diff(x_data).max() if len(x_data) > 1 else np.inf
+        if idx < len(x_values) and abs(x_data[idx] - click_point[0]) <= tol:
             self.x_ax.plot(click_point[0], x_values[idx], 'ro', markersize=6)
 
         # Y軸断面プロット
@@ -112,13 +134,15 @@ class ProfileWindow:
         self.y_ax.grid(True)
 
         # クリックした点をマーク
-        idx = np.abs(y_data - click_point[1]).argmin()
-        if idx < len(y_values):
+        idx = self._nearest(y_data, click_point[1])
+        tol = np.diff(y_data).max() if len(y_data) > 1 else np.inf
+        if idx < len(y_values) and abs(y_data[idx] - click_point[1]) <= tol:
             self.y_ax.plot(click_point[1], y_values[idx], 'ro', markersize=6)
 
         # キャンバスの更新
+        # （draw_idleで2枚の再描画を1回のアイドルサイクルにまとめる）
         self.x_figure.tight_layout()
-        self.x_canvas.draw()
+        self.x_canvas.draw_idle()
 
         self.y_figure.tight_layout()
-        self.y_canvas.draw()
+        self.y_canvas.draw_idle()
@@ -4,8 +4,32 @@
 ステータスバーを提供します。
 """
 
+from contextlib import contextmanager
+from functools import lru_cache
 import tkinter as tk
-from tkinter import ttk
+
+
+@lru_cache(maxsize=4096)
+def _fmt_xy(x, y, value=None):
+    """
+    座標の組を表示用文字列に変換します。
+
+    カーソルが同じデータ点の上にある間は同じ座標で繰り返し呼ばれるため、
+    結果をキャッシュして同一の文字列オブジェクトを返します。同一オブジェクト
+    なら等値チェックも即座に成立し、再フォーマットとTclへの書き込みの
+    両方を省けます。
+
+    Args:
+        x (float): X座標
+        y (float): Y座標
+        value (float, optional): 座標位置のデータ値
+
+    Returns:
+        str: 表示用の座標文字列
+    """
+    if value is None:
+        return f"X: {x:.6g}, Y: {y:.6g}"
+    return f"X: {x:.6g}, Y: {y:.6g}, 値: {value:.6g}"
 
 
 class StatusBar:
@@ -15,6 +39,9 @@ class StatusBar:
     ステータスバーを提供します。
     """
 
+    # メッセージ部の表示幅（半角文字数）
+    MSG_WIDTH = 60
+
     def __init__(self, parent):
         """
         ステータスバーの初期化
@@ -23,23 +50,71 @@ class StatusBar:
             parent: 親ウィジェット
         """
         self.parent = parent
+
+        # 最後に設定した文字列のキャッシュ
+        # （マウス移動による座標表示は同じ文字列で連続して呼ばれることが
+        # 多く、内容が変わらない場合のTclへの書き込みと再描画を省く）
+        self._last_msg = "準備完了"
+        self._last_coords = ""
+
+        # アイドル時にまとめて反映する保留中の文字列と予約フラグ
+        # （<Motion>由来の更新は画面の更新間隔より速く呼ばれるため、
+        # 最新の値だけを保持してアイドルサイクルごとに1回だけ書き込む）
+        self._pending_msg = None
+        self._pending_coords = None
+        self._flush_scheduled = False
+
+        # begin_update/end_updateのネスト深さ
+        self._depth = 0
+
+        # ウィジェットの構築は起動後のアイドル時まで遅延する
+        # （フレームとラベルの生成・packを起動のクリティカルパスから外す。
+        # 構築前に届いた更新は保留文字列として保持し、構築時に反映する）
+        self._built = False
+        parent.after_idle(self._ensure_built)
+
+    def _ensure_built(self):
+        """ウィジェットを未構築であれば構築し、保留中の内容を反映します。"""
+        if self._built:
+            return
         self._create_widgets()
+        self._built = True
+        self._schedule_flush()
 
     def _create_widgets(self):
         """ウィジェットの作成"""
         # メインフレーム
-        self.frame = ttk.Frame(self.parent, relief=tk.SUNKEN, borderwidth=1)
+        # （テーマエンジンを通すttkウィジェットは文字列表示だけの用途には
+        # 過剰で、再描画ごとのスタイル解決コストがかかるため、クラシックな
+        # tk.Frame/tk.Labelを使う）
+        self.frame = tk.Frame(self.parent, relief=tk.SUNKEN, borderwidth=1)
         self.frame.pack(fill=tk.X, side=tk.BOTTOM, padx=2, pady=2)
 
-        # ステータスメッセージ
-        self.status_var = tk.StringVar(value="準備完了")
-        self.status_label = ttk.Label(self.frame, textvariable=self.status_var, anchor=tk.W)
-        self.status_label.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5, pady=2)
+        # ステータスメッセージと座標表示を兼ねる単一のラベル
+        # （StringVar経由だとTcl変数への書き込み→トレース→ラベル更新と
+        # 2段階になるため、ラベルのtextを直接更新する。2つのラベルに
+        # 分けると更新のたびにジオメトリ再計算と再描画が2回発生するため、
+        # 等幅フォントで整形した1つの文字列にまとめる）
+        # widthを固定し、テキスト長が変わってもラベルの要求幅が変化しない
+        # ようにする（要求幅の変化は親フレームを通じてレイアウトの再計算を
+        # 引き起こす）
+        self.status_label = tk.Label(self.frame, text="準備完了", anchor=tk.W, bd=0,
+                                     font="TkFixedFont", width=self.MSG_WIDTH + 20)
+
+        # packはテキスト長の変化のたびにスロットの再計算が走るため、
+        # 列の伸縮比を固定したgridで配置する
+        self.frame.columnconfigure(0, weight=1)
+        self.status_label.grid(row=0, column=0, sticky="ew", padx=5, pady=2)
+
+        # 更新のたびのself.status_label.configureの属性解決を省くため、
+        # バインド済みメソッドを保持しておく
+        self._configure_label = self.status_label.configure
 
-        # 座標表示
-        self.coords_var = tk.StringVar(value="")
-        self.coords_label = ttk.Label(self.frame, textvariable=self.coords_var, anchor=tk.E)
-        self.coords_label.pack(side=tk.RIGHT, padx=5, pady=2)
+        # フレームの高さをラベルの要求サイズで固定し、以降の内容変更が
+        # ジオメトリ計算を親へ伝播させないようにする
+        self.frame.update_idletasks()
+        self.frame.configure(height=self.status_label.winfo_reqheight() + 4)
+        self.frame.grid_propagate(False)
 
     def set_message(self, message):
         """
@@ -48,7 +123,8 @@ class StatusBar:
         Args:
             message (str): 表示するメッセージ
         """
-        self.status_var.set(message)
+        self._pending_msg = message
+        self._schedule_flush()
 
     def set_coords(self, coords):
         """
@@ -57,9 +133,105 @@ class StatusBar:
         Args:
             coords (str): 表示する座標情報
         """
-        self.coords_var.set(coords)
+        self._pending_coords = coords
+        self._schedule_flush()
+
+    def set_coords_xy(self, x, y, value=None):
+        """
+        座標の組から座標表示を設定します。
+
+        呼び出し側でのf文字列生成の代わりにキャッシュ付きフォーマッタを
+        通すため、同じ座標の連続更新では新しい文字列を割り当てません。
+
+        Args:
+            x (float): X座標
+            y (float): Y座標
+            value (float, optional): 座標位置のデータ値
+        """
+        self.set_coords(_fmt_xy(x, y, value))
+
+    def set(self, message=None, coords=None):
+        """
+        メッセージと座標をまとめて設定します。
+
+        両方を同じイベントハンドラから更新する場合に、個別のsetterを
+        2回呼ぶのではなく1回の予約にまとめられます。
+
+        Args:
+            message (str, optional): 表示するメッセージ（Noneなら変更しない）
+            coords (str, optional): 表示する座標情報（Noneなら変更しない）
+        """
+        if message is not None:
+            self._pending_msg = message
+        if coords is not None:
+            self._pending_coords = coords
+        self._schedule_flush()
+
+    def begin_update(self):
+        """更新のバッチを開始します（end_updateまで反映を遅延します）。"""
+        self._depth += 1
+
+    def end_update(self):
+        """更新のバッチを終了し、保留中の内容の反映を予約します。"""
+        self._depth = max(0, self._depth - 1)
+        if self._depth == 0:
+            self._schedule_flush()
+
+    @contextmanager
+    def batch(self):
+        """
+        複数の更新を1回の反映にまとめるコンテキストマネージャ
+
+        with status_bar.batch(): の中で行ったsetter呼び出しは、
+        ブロックを抜けるときにまとめて1回だけ反映されます。
+        """
+        self.begin_update()
+        try:
+            yield self
+        finally:
+            self.end_update()
+
+    def _schedule_flush(self):
+        """保留中の文字列の反映をアイドル時に1回だけ予約します。"""
+        # 未構築の間は保留のままにしておく（構築時に反映される）
+        if not self._built:
+            return
+        if self._flush_scheduled or self._depth > 0:
+            return
+        self._flush_scheduled = True
+        self.frame.after_idle(self._flush)
+
+    def _flush(self):
+        """保留中の文字列をウィジェットに反映します。"""
+        self._flush_scheduled = False
+
+        changed = False
+        if self._pending_msg is not None and self._pending_msg != self._last_msg:
+            self._last_msg = self._pending_msg
+            changed = True
+        self._pending_msg = None
+
+        if self._pending_coords is not None and self._pending_coords != self._last_coords:
+            self._last_coords = self._pending_coords
+            changed = True
+        self._pending_coords = None
+
+        if changed:
+            self._render()
+
+    def _render(self):
+        """メッセージと座標を1つの文字列に合成してラベルに反映します。"""
+        if self._last_coords:
+            text = f"{self._last_msg:<{self.MSG_WIDTH}}{self._last_coords:>20}"
+        else:
+            text = self._last_msg
+        self._configure_label(text=text)
 
     def clear(self):
         """ステータスバーのクリア"""
-        self.status_var.set("")
-        self.coords_var.set("")
+        self._pending_msg = None
+        self._pending_coords = None
+        self._last_msg = ""
+        self._last_coords = ""
+        if self._built:
+            self._configure_label(text="")